@@ -1,18 +1,28 @@
 """
 Graph Representations Comparison
 
-This module implements three different graph representations:
+This module implements six different graph representations:
 1. Edge List - Simple list of edges
 2. Adjacency List - Dictionary/list mapping vertices to their neighbors
 3. Adjacency Matrix - 2D matrix representation
+4. NumPy Adjacency Matrix - Dense float32 matrix with vectorized queries
+5. CSR Graph - Compressed sparse row arrays, built once from an edge list
+6. Bitset Matrix - One bit per cell for dense unweighted graphs
 
 Each representation is benchmarked on common graph operations.
 """
 
+from array import array
 from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from multiprocessing import shared_memory
 from typing import List, Tuple, Dict, Set, Optional
 import heapq
+import os
+import sys
 import time
+import tracemalloc
 import random
 import matplotlib.pyplot as plt
 import numpy as np
@@ -25,10 +35,54 @@ REPRESENTATIONS_CONFIG = {
     "Edge List": True,  # Set to False to exclude Edge List from benchmarks
     "Adjacency List": True,  # Set to False to exclude Adjacency List
     "Adjacency Matrix": True,  # Set to False to exclude Adjacency Matrix
+    "NumPy Matrix": True,  # Set to False to exclude NumPy Adjacency Matrix
+    "CSR": True,  # Set to False to exclude CSR Graph
+    "Indexed Edge List": True,  # Edge List with a hashed edge index
+    "Indexed Adj List": True,  # Adjacency List with a hashed edge index
+    "Bitset Matrix": True,  # Set to False to exclude Bitset Matrix (unweighted)
 }
 # ============================================================================
 
 
+def edge_arrays(edges, directed: bool = False):
+    """
+    Split an edge list or (E, 3) NumPy edge array into source, target and
+    weight arrays. For undirected graphs each edge is followed by its
+    reverse, in the same order add_edge() would store them
+    """
+    edge_array = np.asarray(edges, dtype=np.float64).reshape(-1, 3)
+    sources = edge_array[:, 0].astype(np.int64)
+    targets = edge_array[:, 1].astype(np.int64)
+    weights = edge_array[:, 2]
+    if not directed:
+        sources, targets = (
+            np.column_stack((sources, targets)).ravel(),
+            np.column_stack((targets, sources)).ravel(),
+        )
+        weights = np.repeat(weights, 2)
+    return sources, targets, weights
+
+
+def group_by_source(num_vertices: int, sources, targets, weights):
+    """
+    Radix sort of directed edges by source vertex
+    Returns (indptr, targets, weights) with the neighbors of u at
+    indptr[u]:indptr[u + 1], in their original order
+
+    Sorts on the low and then the high 16 bits of the source, so both passes
+    run as NumPy's stable counting sort on uint16 keys instead of a
+    comparison sort (supports up to 2**32 vertices)
+    """
+    counts = np.bincount(sources, minlength=num_vertices)
+    indptr = np.zeros(num_vertices + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+    order = np.argsort((sources & 0xFFFF).astype(np.uint16), kind="stable")
+    if num_vertices > 0x10000:
+        high = (sources[order] >> 16).astype(np.uint16)
+        order = order[np.argsort(high, kind="stable")]
+    return indptr, targets[order], weights[order]
+
+
 class EdgeList:
     """
     Edge List Representation
@@ -38,19 +92,55 @@ class EdgeList:
     Cons: Slow neighbor lookups, slow edge existence checks
     """
 
-    def __init__(self, num_vertices: int, directed: bool = False):
+    def __init__(
+        self, num_vertices: int, directed: bool = False, edge_index: bool = False
+    ):
         self.num_vertices = num_vertices
         self.directed = directed
         self.edges: List[Tuple[int, int, float]] = []
+        # Optional set of u * num_vertices + v for O(1) has_edge
+        self.edge_index: Optional[Set[int]] = set() if edge_index else None
+
+    @classmethod
+    def from_edges(cls, num_vertices: int, edges, directed: bool = False):
+        """
+        Build the graph from a whole edge array at once
+
+        Slower than repeated add_edge() calls on Python edge tuples: every
+        stored tuple must be rebuilt from NumPy scalars, which costs more
+        than the list appends it replaces
+        """
+        graph = cls(num_vertices, directed)
+        sources, targets, weights = edge_arrays(edges, directed=True)
+        u, v, w = sources.tolist(), targets.tolist(), weights.tolist()
+        if directed:
+            graph.edges = list(zip(u, v, w))
+        else:
+            # Convert each column once and interleave the reverse edges
+            graph.edges = [None] * (2 * len(u))
+            graph.edges[0::2] = zip(u, v, w)
+            graph.edges[1::2] = zip(v, u, w)
+        if graph.edge_index is not None:
+            keys = sources * num_vertices + targets
+            if not directed:
+                keys = np.concatenate((keys, targets * num_vertices + sources))
+            graph.edge_index = set(keys.tolist())
+        return graph
 
     def add_edge(self, u: int, v: int, weight: float = 1.0):
         """Add an edge to the graph"""
         self.edges.append((u, v, weight))
         if not self.directed:
             self.edges.append((v, u, weight))
+        if self.edge_index is not None:
+            self.edge_index.add(u * self.num_vertices + v)
+            if not self.directed:
+                self.edge_index.add(v * self.num_vertices + u)
 
     def has_edge(self, u: int, v: int) -> bool:
         """Check if edge exists between u and v"""
+        if self.edge_index is not None:
+            return u * self.num_vertices + v in self.edge_index
         for edge_u, edge_v, _ in self.edges:
             if edge_u == u and edge_v == v:
                 return True
@@ -82,19 +172,46 @@ class AdjacencyList:
     Cons: Slower edge existence checks than adjacency matrix
     """
 
-    def __init__(self, num_vertices: int, directed: bool = False):
+    def __init__(
+        self, num_vertices: int, directed: bool = False, edge_index: bool = False
+    ):
         self.num_vertices = num_vertices
         self.directed = directed
         self.adj_list: Dict[int, List[Tuple[int, float]]] = defaultdict(list)
+        # Optional set of u * num_vertices + v for O(1) has_edge
+        self.edge_index: Optional[Set[int]] = set() if edge_index else None
+
+    @classmethod
+    def from_edges(cls, num_vertices: int, edges, directed: bool = False):
+        """Build the graph from a whole edge array, grouped by a counting sort"""
+        graph = cls(num_vertices, directed)
+        sources, targets, weights = edge_arrays(edges, directed)
+        if graph.edge_index is not None:
+            graph.edge_index = set((sources * num_vertices + targets).tolist())
+        indptr, targets, weights = group_by_source(
+            num_vertices, sources, targets, weights
+        )
+        indptr = indptr.tolist()
+        pairs = list(zip(targets.tolist(), weights.tolist()))
+        for u in range(num_vertices):
+            if indptr[u] < indptr[u + 1]:
+                graph.adj_list[u] = pairs[indptr[u] : indptr[u + 1]]
+        return graph
 
     def add_edge(self, u: int, v: int, weight: float = 1.0):
         """Add an edge to the graph"""
         self.adj_list[u].append((v, weight))
         if not self.directed:
             self.adj_list[v].append((u, weight))
+        if self.edge_index is not None:
+            self.edge_index.add(u * self.num_vertices + v)
+            if not self.directed:
+                self.edge_index.add(v * self.num_vertices + u)
 
     def has_edge(self, u: int, v: int) -> bool:
         """Check if edge exists between u and v"""
+        if self.edge_index is not None:
+            return u * self.num_vertices + v in self.edge_index
         if u not in self.adj_list:
             return False
         return any(neighbor == v for neighbor, _ in self.adj_list[u])
@@ -108,6 +225,29 @@ class AdjacencyList:
         return set(self.adj_list.keys())
 
 
+def edge_index_memory(graph) -> int:
+    """Bytes used by a graph's hashed edge index, including the int keys"""
+    if graph.edge_index is None:
+        return 0
+    return sys.getsizeof(graph.edge_index) + sum(
+        sys.getsizeof(key) for key in graph.edge_index
+    )
+
+
+class IndexedEdgeList(EdgeList):
+    """Edge List with the hashed edge index enabled"""
+
+    def __init__(self, num_vertices: int, directed: bool = False):
+        super().__init__(num_vertices, directed, edge_index=True)
+
+
+class IndexedAdjacencyList(AdjacencyList):
+    """Adjacency List with the hashed edge index enabled"""
+
+    def __init__(self, num_vertices: int, directed: bool = False):
+        super().__init__(num_vertices, directed, edge_index=True)
+
+
 class AdjacencyMatrix:
     """
     Adjacency Matrix Representation
@@ -126,6 +266,30 @@ class AdjacencyMatrix:
         for i in range(num_vertices):
             self.matrix[i][i] = 0
 
+    @classmethod
+    def from_edges(cls, num_vertices: int, edges, directed: bool = False):
+        """
+        Build each row from its grouped edges, sharing one inf object per
+        missing cell as the per-edge constructor does
+        """
+        graph = cls.__new__(cls)
+        graph.num_vertices = num_vertices
+        graph.directed = directed
+        indptr, targets, weights = group_by_source(
+            num_vertices, *edge_arrays(edges, directed)
+        )
+        indptr, targets, weights = indptr.tolist(), targets.tolist(), weights.tolist()
+        inf = float("inf")
+        graph.matrix = []
+        for u in range(num_vertices):
+            row = [inf] * num_vertices
+            for i in range(indptr[u], indptr[u + 1]):
+                row[targets[i]] = weights[i]
+            # Distance from vertex to itself is 0
+            row[u] = 0
+            graph.matrix.append(row)
+        return graph
+
     def add_edge(self, u: int, v: int, weight: float = 1.0):
         """Add an edge to the graph"""
         self.matrix[u][v] = weight
@@ -155,6 +319,326 @@ class AdjacencyMatrix:
         return vertices if vertices else set(range(self.num_vertices))
 
 
+class NumpyAdjacencyMatrix:
+    """
+    NumPy Adjacency Matrix Representation
+    Dense float32 matrix with infinity for missing edges, plus a boolean mask
+    of the edges that exist
+
+    Pros: Vectorized neighbor queries and BFS frontier expansion, 4 bytes per cell
+    Cons: Still O(V²) space, float32 weights
+    """
+
+    def __init__(self, num_vertices: int, directed: bool = False):
+        self.num_vertices = num_vertices
+        self.directed = directed
+        self.matrix = np.full((num_vertices, num_vertices), np.inf, dtype=np.float32)
+        np.fill_diagonal(self.matrix, 0)
+        self.mask = np.zeros((num_vertices, num_vertices), dtype=bool)
+
+    @classmethod
+    def from_edges(cls, num_vertices: int, edges, directed: bool = False):
+        """Build the matrix with fancy-index assignment"""
+        graph = cls(num_vertices, directed)
+        sources, targets, weights = edge_arrays(edges, directed)
+        graph.matrix[sources, targets] = weights
+        graph.mask[sources, targets] = sources != targets
+        np.fill_diagonal(graph.matrix, 0)
+        return graph
+
+    def add_edge(self, u: int, v: int, weight: float = 1.0):
+        """Add an edge to the graph"""
+        self.matrix[u, v] = weight
+        self.mask[u, v] = u != v
+        if not self.directed:
+            self.matrix[v, u] = weight
+            self.mask[v, u] = u != v
+
+    def has_edge(self, u: int, v: int) -> bool:
+        """Check if edge exists between u and v"""
+        return bool(self.mask[u, v])
+
+    def get_neighbors(self, u: int) -> List[Tuple[int, float]]:
+        """Get all neighbors of vertex u with their weights"""
+        neighbors = np.flatnonzero(self.mask[u])
+        return list(zip(neighbors.tolist(), self.matrix[u, neighbors].tolist()))
+
+    def get_all_vertices(self) -> Set[int]:
+        """Get all vertices in the graph"""
+        vertices = np.flatnonzero(self.mask.any(axis=0) | self.mask.any(axis=1))
+        return (
+            set(vertices.tolist()) if len(vertices) else set(range(self.num_vertices))
+        )
+
+    def bfs(self, start: int) -> Dict[int, int]:
+        """BFS expanding a whole frontier at once with boolean row operations"""
+        visited = np.zeros(self.num_vertices, dtype=bool)
+        visited[start] = True
+        frontier = np.array([start])
+        distances = {start: 0}
+        depth = 0
+        while len(frontier):
+            depth += 1
+            reached = self.mask[frontier].any(axis=0) & ~visited
+            frontier = np.flatnonzero(reached)
+            visited[frontier] = True
+            distances.update(dict.fromkeys(frontier.tolist(), depth))
+        return distances
+
+    def direction_optimizing_bfs(self, start: int) -> Dict[int, int]:
+        """
+        BFS that reads whole mask rows in whichever direction touches fewer:
+        the frontier rows (top-down) or the rows of the incoming edges of the
+        unvisited vertices, AND the frontier (bottom-up)
+        """
+        in_mask = self.mask.T if self.directed else self.mask
+        visited = np.zeros(self.num_vertices, dtype=bool)
+        visited[start] = True
+        frontier = np.array([start])
+        distances = {start: 0}
+        depth = 0
+        while len(frontier):
+            depth += 1
+            unvisited = np.flatnonzero(~visited)
+            if len(frontier) > len(unvisited):
+                in_frontier = np.zeros(self.num_vertices, dtype=bool)
+                in_frontier[frontier] = True
+                frontier = unvisited[(in_mask[unvisited] & in_frontier).any(axis=1)]
+            else:
+                reached = self.mask[frontier].any(axis=0) & ~visited
+                frontier = np.flatnonzero(reached)
+            visited[frontier] = True
+            distances.update(dict.fromkeys(frontier.tolist(), depth))
+        return distances
+
+
+class CSRGraph:
+    """
+    Compressed Sparse Row Representation
+    The neighbors of u are indices[indptr[u]:indptr[u + 1]], with matching
+    weights, stored in typed arrays
+
+    Pros: Compact (12 bytes per edge), neighbor slices without allocation
+    Cons: Static, must be built from the complete edge list at once
+    """
+
+    def __init__(
+        self,
+        num_vertices: int,
+        directed: bool = False,
+        edges: List[Tuple[int, int, float]] = (),
+    ):
+        self.num_vertices = num_vertices
+        self.directed = directed
+
+        # Counting sort of the edges by source vertex
+        counts = [0] * (num_vertices + 1)
+        for u, v, _ in edges:
+            counts[u + 1] += 1
+            if not directed:
+                counts[v + 1] += 1
+        for u in range(num_vertices):
+            counts[u + 1] += counts[u]
+        self.indptr = array("q", counts)
+
+        num_entries = counts[num_vertices]
+        self.indices = array("i", bytes(4 * num_entries))
+        self.weights = array("d", bytes(8 * num_entries))
+        position = counts[:num_vertices]
+        for u, v, weight in edges:
+            self.indices[position[u]] = v
+            self.weights[position[u]] = weight
+            position[u] += 1
+            if not directed:
+                self.indices[position[v]] = u
+                self.weights[position[v]] = weight
+                position[v] += 1
+
+        self._indices = memoryview(self.indices)
+        self._weights = memoryview(self.weights)
+        self._reverse: Optional["CSRGraph"] = None
+
+    @classmethod
+    def from_edges(cls, num_vertices: int, edges, directed: bool = False):
+        """Build the CSR arrays with a NumPy counting sort"""
+        graph = cls(num_vertices, directed)
+        indptr, targets, weights = group_by_source(
+            num_vertices, *edge_arrays(edges, directed)
+        )
+        graph.indptr = array("q", indptr.tobytes())
+        graph.indices = array("i", targets.astype(np.int32).tobytes())
+        graph.weights = array("d", weights.tobytes())
+        graph._indices = memoryview(graph.indices)
+        graph._weights = memoryview(graph.weights)
+        return graph
+
+    def add_edge(self, u: int, v: int, weight: float = 1.0):
+        """CSR graphs are static; build them from the edge list instead"""
+        raise TypeError("CSRGraph must be built from a complete edge list")
+
+    def reverse(self) -> "CSRGraph":
+        """CSR of the incoming edges, built once and cached (self if undirected)"""
+        if not self.directed:
+            return self
+        if self._reverse is None:
+            edges = [
+                (self.indices[i], u, self.weights[i])
+                for u in range(self.num_vertices)
+                for i in range(self.indptr[u], self.indptr[u + 1])
+            ]
+            self._reverse = CSRGraph(self.num_vertices, True, edges)
+        return self._reverse
+
+    def neighbors(self, u: int) -> Tuple[memoryview, memoryview]:
+        """Zero-copy views of the neighbor ids and weights of u"""
+        start, end = self.indptr[u], self.indptr[u + 1]
+        return self._indices[start:end], self._weights[start:end]
+
+    def has_edge(self, u: int, v: int) -> bool:
+        """Check if edge exists between u and v"""
+        start, end = self.indptr[u], self.indptr[u + 1]
+        return v in self._indices[start:end]
+
+    def get_neighbors(self, u: int) -> List[Tuple[int, float]]:
+        """Get all neighbors of vertex u with their weights"""
+        return list(zip(*self.neighbors(u)))
+
+    def get_all_vertices(self) -> Set[int]:
+        """Get all vertices that have edges"""
+        return {
+            u for u in range(self.num_vertices) if self.indptr[u] < self.indptr[u + 1]
+        }
+
+
+class BitsetMatrix:
+    """
+    Bitset Adjacency Matrix Representation
+    Row u is a Python int whose bit v is set if the edge (u, v) exists.
+    Edges are unweighted; get_neighbors reports weight 1.0
+
+    Pros: One bit per cell, BFS frontiers expand with bitwise OR / AND-NOT
+    Cons: No weights, O(V²) bits even for sparse graphs
+    """
+
+    def __init__(self, num_vertices: int, directed: bool = False):
+        self.num_vertices = num_vertices
+        self.directed = directed
+        self.rows: List[int] = [0] * num_vertices
+
+    @classmethod
+    def from_edges(cls, num_vertices: int, edges, directed: bool = False):
+        """Build every row bitset at once with np.packbits"""
+        graph = cls(num_vertices, directed)
+        indptr, targets, _ = group_by_source(
+            num_vertices, *edge_arrays(edges, directed)
+        )
+        row = np.zeros(num_vertices, dtype=bool)
+        for u in range(num_vertices):
+            neighbors = targets[indptr[u] : indptr[u + 1]]
+            if len(neighbors):
+                row[neighbors] = True
+                packed = np.packbits(row, bitorder="little").tobytes()
+                graph.rows[u] = int.from_bytes(packed, "little")
+                row[neighbors] = False
+        return graph
+
+    def add_edge(self, u: int, v: int, weight: float = 1.0):
+        """Add an edge to the graph (the weight is ignored)"""
+        self.rows[u] |= 1 << v
+        if not self.directed:
+            self.rows[v] |= 1 << u
+
+    def has_edge(self, u: int, v: int) -> bool:
+        """Check if edge exists between u and v"""
+        return (self.rows[u] >> v) & 1 == 1
+
+    @staticmethod
+    def bits(bitset: int) -> List[int]:
+        """Indices of the set bits, lowest first"""
+        indices = []
+        while bitset:
+            lowest = bitset & -bitset
+            indices.append(lowest.bit_length() - 1)
+            bitset ^= lowest
+        return indices
+
+    def get_neighbors(self, u: int) -> List[Tuple[int, float]]:
+        """Get all neighbors of vertex u with weight 1.0"""
+        return [(v, 1.0) for v in self.bits(self.rows[u])]
+
+    def get_all_vertices(self) -> Set[int]:
+        """Get all vertices that have edges"""
+        vertices = set()
+        for u, row in enumerate(self.rows):
+            if row:
+                vertices.add(u)
+                vertices.update(self.bits(row))
+        return vertices
+
+    def bfs(self, start: int) -> Dict[int, int]:
+        """BFS where each level is the OR of the frontier rows AND-NOT visited"""
+        visited = 1 << start
+        frontier = [start]
+        distances = {start: 0}
+        depth = 0
+        while frontier:
+            depth += 1
+            reached = 0
+            for u in frontier:
+                reached |= self.rows[u]
+            reached &= ~visited
+            visited |= reached
+            frontier = self.bits(reached)
+            distances.update(dict.fromkeys(frontier, depth))
+        return distances
+
+    def columns(self) -> List[int]:
+        """Bitsets of the incoming edges of every vertex (the rows if undirected)"""
+        if not self.directed:
+            return self.rows
+        columns = [0] * self.num_vertices
+        for u, row in enumerate(self.rows):
+            for v in self.bits(row):
+                columns[v] |= 1 << u
+        return columns
+
+    def direction_optimizing_bfs(self, start: int) -> Dict[int, int]:
+        """
+        BFS that ORs the frontier rows (top-down) while the frontier is smaller
+        than the unvisited set, and otherwise ANDs the incoming-edge bitset of
+        every unvisited vertex with the frontier (bottom-up)
+        """
+        columns = None  # Built when the search first goes bottom-up
+        everything = (1 << self.num_vertices) - 1
+        visited = 1 << start
+        reached = visited
+        frontier = [start]
+        num_unvisited = self.num_vertices - 1
+        distances = {start: 0}
+        depth = 0
+        while frontier:
+            depth += 1
+            if len(frontier) > num_unvisited:
+                if columns is None:
+                    columns = self.columns()
+                frontier = [
+                    v for v in self.bits(everything & ~visited) if columns[v] & reached
+                ]
+                reached = 0
+                for v in frontier:
+                    reached |= 1 << v
+            else:
+                reached = 0
+                for u in frontier:
+                    reached |= self.rows[u]
+                reached &= ~visited
+                frontier = self.bits(reached)
+            visited |= reached
+            num_unvisited -= len(frontier)
+            distances.update(dict.fromkeys(frontier, depth))
+        return distances
+
+
 # Graph Algorithm Implementations
 
 
@@ -162,7 +646,13 @@ def bfs(graph, start: int) -> Dict[int, int]:
     """
     Breadth-First Search
     Returns dictionary mapping each reachable vertex to its distance from start
+    Representations with their own vectorized bfs() use that instead
     """
+    if hasattr(graph, "bfs"):
+        return graph.bfs(start)
+    if isinstance(graph, CSRGraph):
+        return bfs_csr(graph, start)
+
     distances = {start: 0}
     queue = deque([start])
 
@@ -176,11 +666,109 @@ def bfs(graph, start: int) -> Dict[int, int]:
     return distances
 
 
+def bfs_csr(graph: CSRGraph, start: int) -> Dict[int, int]:
+    """BFS reading neighbor ids straight from the CSR arrays"""
+    distances = {start: 0}
+    queue = deque([start])
+    indptr = graph.indptr
+    indices = graph._indices
+
+    while queue:
+        u = queue.popleft()
+        for v in indices[indptr[u] : indptr[u + 1]]:
+            if v not in distances:
+                distances[v] = distances[u] + 1
+                queue.append(v)
+
+    return distances
+
+
+def direction_optimizing_bfs(
+    graph, start: int, alpha: float = 14, beta: float = 24
+) -> Dict[int, int]:
+    """
+    Direction-Optimizing BFS (Beamer et al.)
+    Expands small frontiers top-down and switches to bottom-up, where every
+    unvisited vertex looks for a parent in the frontier and stops at the
+    first one, once the frontier's edges exceed those of the unvisited
+    vertices divided by alpha. It switches back when the frontier shrinks
+    below num_vertices / beta. Returns the same distances as bfs()
+    Runs on CSRGraph; NumpyAdjacencyMatrix and BitsetMatrix use their own
+    direction_optimizing_bfs(), and other representations fall back to bfs()
+    """
+    if hasattr(graph, "direction_optimizing_bfs"):
+        return graph.direction_optimizing_bfs(start)
+    if not isinstance(graph, CSRGraph):
+        return bfs(graph, start)
+
+    num_vertices = graph.num_vertices
+    indptr = graph.indptr
+    indices = graph._indices
+
+    depth = [-1] * num_vertices
+    depth[start] = 0
+    frontier = [start]
+    # Unvisited vertices, only kept up to date while going bottom-up
+    unvisited = None
+    # Edges still to be checked from the unvisited side
+    frontier_edges = indptr[start + 1] - indptr[start]
+    unexplored_edges = len(indices) - frontier_edges
+    level = 0
+    bottom_up = False
+
+    while frontier:
+        level += 1
+        if not bottom_up and frontier_edges > unexplored_edges / alpha:
+            bottom_up = True
+        elif bottom_up and len(frontier) < num_vertices / beta:
+            bottom_up = False
+
+        next_frontier = []
+        next_edges = 0
+        if bottom_up:
+            if unvisited is None:
+                reverse = graph.reverse()
+                in_indptr = reverse.indptr
+                in_indices = reverse._indices
+                unvisited = [v for v in range(num_vertices) if depth[v] < 0]
+            in_frontier = bytearray(num_vertices)
+            for u in frontier:
+                in_frontier[u] = 1
+            still_unvisited = []
+            for v in unvisited:
+                for u in in_indices[in_indptr[v] : in_indptr[v + 1]]:
+                    if in_frontier[u]:
+                        depth[v] = level
+                        next_frontier.append(v)
+                        next_edges += indptr[v + 1] - indptr[v]
+                        break
+                else:
+                    still_unvisited.append(v)
+            unvisited = still_unvisited
+        else:
+            for u in frontier:
+                for v in indices[indptr[u] : indptr[u + 1]]:
+                    if depth[v] < 0:
+                        depth[v] = level
+                        next_frontier.append(v)
+                        next_edges += indptr[v + 1] - indptr[v]
+            unvisited = None
+
+        unexplored_edges -= next_edges
+        frontier = next_frontier
+        frontier_edges = next_edges
+
+    return {v: d for v, d in enumerate(depth) if d >= 0}
+
+
 def dfs(graph, start: int) -> Set[int]:
     """
     Depth-First Search
     Returns set of all vertices reachable from start
     """
+    if isinstance(graph, CSRGraph):
+        return dfs_csr(graph, start)
+
     visited = set()
     stack = [start]
 
@@ -195,32 +783,507 @@ def dfs(graph, start: int) -> Set[int]:
     return visited
 
 
-def dijkstra(graph, start: int) -> Dict[int, float]:
+def dfs_csr(graph: CSRGraph, start: int) -> Set[int]:
+    """DFS reading neighbor ids straight from the CSR arrays"""
+    visited = set()
+    stack = [start]
+    indptr = graph.indptr
+    indices = graph._indices
+
+    while stack:
+        u = stack.pop()
+        if u not in visited:
+            visited.add(u)
+            for v in indices[indptr[u] : indptr[u + 1]]:
+                if v not in visited:
+                    stack.append(v)
+
+    return visited
+
+
+def dijkstra(
+    graph,
+    start: int,
+    target: Optional[int] = None,
+    stats: Optional[Dict[str, int]] = None,
+) -> Dict[int, float]:
     """
     Dijkstra's Shortest Path Algorithm
     Returns dictionary mapping each vertex to its shortest distance from start
+    With a target it stops once the target is settled; only distances of
+    settled vertices (including the target) are then final
+    If stats is a dict, heap pushes and pops are counted into it
     """
+    if isinstance(graph, CSRGraph):
+        return dijkstra_csr(graph, start, target, stats)
+
     distances = {start: 0}
     pq = [(0, start)]  # (distance, vertex)
     visited = set()
+    pushes, pops = 1, 0
 
     while pq:
         dist, u = heapq.heappop(pq)
+        pops += 1
 
         if u in visited:
             continue
 
         visited.add(u)
+        if u == target:
+            break
 
         for v, weight in graph.get_neighbors(u):
             new_dist = dist + weight
             if v not in distances or new_dist < distances[v]:
                 distances[v] = new_dist
                 heapq.heappush(pq, (new_dist, v))
+                pushes += 1
 
+    if stats is not None:
+        stats["push"] = stats.get("push", 0) + pushes
+        stats["pop"] = stats.get("pop", 0) + pops
+        stats["settled"] = stats.get("settled", 0) + len(visited)
     return distances
 
 
+def dijkstra_csr(
+    graph: CSRGraph,
+    start: int,
+    target: Optional[int] = None,
+    stats: Optional[Dict[str, int]] = None,
+) -> Dict[int, float]:
+    """Dijkstra reading neighbors and weights straight from the CSR arrays"""
+    distances = {start: 0}
+    pq = [(0, start)]
+    visited = set()
+    indptr = graph.indptr
+    indices = graph._indices
+    weights = graph._weights
+    pushes, pops = 1, 0
+
+    while pq:
+        dist, u = heapq.heappop(pq)
+        pops += 1
+
+        if u in visited:
+            continue
+
+        visited.add(u)
+        if u == target:
+            break
+
+        for i in range(indptr[u], indptr[u + 1]):
+            v = indices[i]
+            new_dist = dist + weights[i]
+            if v not in distances or new_dist < distances[v]:
+                distances[v] = new_dist
+                heapq.heappush(pq, (new_dist, v))
+                pushes += 1
+
+    if stats is not None:
+        stats["push"] = stats.get("push", 0) + pushes
+        stats["pop"] = stats.get("pop", 0) + pops
+        stats["settled"] = stats.get("settled", 0) + len(visited)
+    return distances
+
+
+class IndexedHeap:
+    """
+    Binary min-heap of vertices keyed by distance, with a position index so
+    a vertex's key can be decreased in place instead of pushing a duplicate
+    Counts push, pop and decrease_key operations
+    """
+
+    def __init__(self):
+        self.heap: List[int] = []
+        self.keys: Dict[int, float] = {}
+        self.position: Dict[int, int] = {}
+        self.counts = {"push": 0, "pop": 0, "decrease_key": 0}
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __contains__(self, v: int) -> bool:
+        return v in self.position
+
+    def push(self, v: int, key: float):
+        """Insert a vertex that is not in the heap"""
+        self.counts["push"] += 1
+        self.keys[v] = key
+        self.position[v] = len(self.heap)
+        self.heap.append(v)
+        self._sift_up(len(self.heap) - 1)
+
+    def decrease_key(self, v: int, key: float):
+        """Lower the key of a vertex already in the heap"""
+        self.counts["decrease_key"] += 1
+        self.keys[v] = key
+        self._sift_up(self.position[v])
+
+    def push_or_decrease(self, v: int, key: float):
+        if v in self.position:
+            self.decrease_key(v, key)
+        else:
+            self.push(v, key)
+
+    def peek_key(self) -> float:
+        return self.keys[self.heap[0]]
+
+    def pop(self) -> Tuple[float, int]:
+        """Remove and return (key, vertex) with the smallest key"""
+        self.counts["pop"] += 1
+        heap = self.heap
+        top = heap[0]
+        last = heap.pop()
+        del self.position[top]
+        if heap:
+            heap[0] = last
+            self.position[last] = 0
+            self._sift_down(0)
+        return self.keys.pop(top), top
+
+    def _sift_up(self, i: int):
+        heap, keys, position = self.heap, self.keys, self.position
+        v = heap[i]
+        key = keys[v]
+        while i > 0:
+            parent = (i - 1) // 2
+            if keys[heap[parent]] <= key:
+                break
+            heap[i] = heap[parent]
+            position[heap[i]] = i
+            i = parent
+        heap[i] = v
+        position[v] = i
+
+    def _sift_down(self, i: int):
+        heap, keys, position = self.heap, self.keys, self.position
+        n = len(heap)
+        v = heap[i]
+        key = keys[v]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and keys[heap[child + 1]] < keys[heap[child]]:
+                child += 1
+            if keys[heap[child]] >= key:
+                break
+            heap[i] = heap[child]
+            position[heap[i]] = i
+            i = child
+        heap[i] = v
+        position[v] = i
+
+
+def dijkstra_indexed(
+    graph,
+    start: int,
+    target: Optional[int] = None,
+    stats: Optional[Dict[str, int]] = None,
+) -> Dict[int, float]:
+    """
+    Dijkstra with an IndexedHeap and true decrease-key
+    Same results and target/stats handling as dijkstra()
+    """
+    distances = {start: 0}
+    heap = IndexedHeap()
+    heap.push(start, 0)
+    settled = set()
+
+    while heap:
+        dist, u = heap.pop()
+        settled.add(u)
+        if u == target:
+            break
+
+        for v, weight in graph.get_neighbors(u):
+            new_dist = dist + weight
+            if v not in distances or new_dist < distances[v]:
+                distances[v] = new_dist
+                heap.push_or_decrease(v, new_dist)
+
+    if stats is not None:
+        for operation, count in heap.counts.items():
+            stats[operation] = stats.get(operation, 0) + count
+        stats["settled"] = stats.get("settled", 0) + len(settled)
+    return distances
+
+
+def reverse_graph(graph):
+    """Graph with every edge reversed, as an AdjacencyList (the graph itself if undirected)"""
+    if not graph.directed:
+        return graph
+    reverse = AdjacencyList(graph.num_vertices, directed=True)
+    for u in range(graph.num_vertices):
+        for v, weight in graph.get_neighbors(u):
+            reverse.add_edge(v, u, weight)
+    return reverse
+
+
+def bidirectional_dijkstra(
+    graph,
+    source: int,
+    target: int,
+    reverse=None,
+    stats: Optional[Dict[str, int]] = None,
+) -> float:
+    """
+    Point-to-point shortest distance, searching from both ends at once
+    Alternates forward steps on graph and backward steps on reverse (built
+    with reverse_graph() if not given) and stops once the two smallest heap
+    keys add up to at least the best path found. Returns inf if unreachable
+    """
+    if source == target:
+        return 0
+    if reverse is None:
+        reverse = reverse_graph(graph)
+
+    searches = [
+        (graph, {source: 0}, IndexedHeap(), set()),
+        (reverse, {target: 0}, IndexedHeap(), set()),
+    ]
+    searches[0][2].push(source, 0)
+    searches[1][2].push(target, 0)
+    best = float("inf")
+
+    side = 0
+    while searches[0][2] and searches[1][2]:
+        if searches[0][2].peek_key() + searches[1][2].peek_key() >= best:
+            break
+        current, distances, heap, settled = searches[side]
+        other_distances = searches[1 - side][1]
+        dist, u = heap.pop()
+        settled.add(u)
+        for v, weight in current.get_neighbors(u):
+            new_dist = dist + weight
+            if v not in distances or new_dist < distances[v]:
+                distances[v] = new_dist
+                heap.push_or_decrease(v, new_dist)
+            if v in other_distances:
+                best = min(best, distances[v] + other_distances[v])
+        side = 1 - side
+
+    if stats is not None:
+        for _, _, heap, settled in searches:
+            for operation, count in heap.counts.items():
+                stats[operation] = stats.get(operation, 0) + count
+            stats["settled"] = stats.get("settled", 0) + len(settled)
+    return best
+
+
+class Landmarks:
+    """
+    ALT (A*, Landmarks, Triangle inequality) preprocessing
+    Picks k landmarks by farthest-point selection and stores the distances
+    from (and, for directed graphs, to) each landmark in flat typed arrays,
+    k * num_vertices doubles each, inf where unreachable. The arrays are
+    vertex-major: the k distances of v are at v * k:(v + 1) * k
+    """
+
+    def __init__(self, graph, k: int = 8, seed: Optional[int] = None):
+        rng = random.Random(seed)
+        self.num_vertices = n = graph.num_vertices
+        self.directed = graph.directed
+        reverse = reverse_graph(graph)
+        inf = float("inf")
+
+        self.vertices: List[int] = []
+        from_rows = []
+        to_rows = []
+        # Start from the vertex farthest from a random one
+        distances = dijkstra(graph, rng.randrange(n))
+        candidate = max(distances, key=distances.get)
+        closest = [inf] * n
+        for _ in range(min(k, n)):
+            self.vertices.append(candidate)
+            distances = dijkstra(graph, candidate)
+            row = [distances.get(v, inf) for v in range(n)]
+            from_rows.append(row)
+            if self.directed:
+                to_distances = dijkstra(reverse, candidate)
+                to_rows.append([to_distances.get(v, inf) for v in range(n)])
+            # The next landmark is the reachable vertex farthest from all
+            # chosen ones; once those are exhausted, an unreached vertex with edges
+            closest = [min(a, b) for a, b in zip(closest, row)]
+            reachable = [v for v in range(n) if closest[v] < inf]
+            candidate = max(reachable, key=closest.__getitem__)
+            if closest[candidate] == 0:
+                unreached = [
+                    v for v in range(n) if closest[v] == inf and graph.get_neighbors(v)
+                ]
+                if not unreached:
+                    break
+                candidate = rng.choice(unreached)
+
+        # Interleave the per-landmark rows into vertex-major order
+        self.from_landmark = array("d", chain.from_iterable(zip(*from_rows)))
+        self.to_landmark = array("d", chain.from_iterable(zip(*to_rows)))
+
+    def lower_bound_function(self, target: int):
+        """
+        Return h(v), a lower bound on the distance from v to target
+        h(v) = max over landmarks L of d(L, t) - d(L, v) and d(v, L) - d(t, L),
+        using only finite distances (|d(L, t) - d(L, v)| if undirected).
+        Bounds are cached, so build a new function for every query
+        """
+        k = len(self.vertices)
+        inf = float("inf")
+        directed = self.directed
+        from_landmark = self.from_landmark
+        to_landmark = self.to_landmark
+        # (landmark, distance) pairs whose target distance is finite
+        target_from = [
+            (i, distance)
+            for i, distance in enumerate(from_landmark[target * k : (target + 1) * k])
+            if distance < inf
+        ]
+        target_to = [
+            (i, distance)
+            for i, distance in enumerate(to_landmark[target * k : (target + 1) * k])
+            if distance < inf
+        ]
+        cache: Dict[int, float] = {}
+
+        def h(v: int) -> float:
+            bound = cache.get(v)
+            if bound is not None:
+                return bound
+            bound = 0.0
+            start = v * k
+            for i, target_distance in target_from:
+                distance = from_landmark[start + i]
+                if distance < inf:
+                    difference = target_distance - distance
+                    if not directed:
+                        difference = abs(difference)
+                    if difference > bound:
+                        bound = difference
+            for i, target_distance in target_to:
+                distance = to_landmark[start + i]
+                if distance < inf and distance - target_distance > bound:
+                    bound = distance - target_distance
+            cache[v] = bound
+            return bound
+
+        return h
+
+
+def astar(
+    graph,
+    source: int,
+    target: int,
+    landmarks: Optional[Landmarks] = None,
+    stats: Optional[Dict[str, int]] = None,
+) -> float:
+    """
+    A* point-to-point query, with the ALT lower bound if landmarks are given
+    (plain Dijkstra with early exit otherwise). Returns inf if unreachable
+    The ALT bound is consistent, so every vertex is settled at most once
+    """
+    h = landmarks.lower_bound_function(target) if landmarks else (lambda v: 0.0)
+    distances = {source: 0}
+    pq = [(h(source), source)]
+    settled = set()
+    result = float("inf")
+
+    while pq:
+        _, u = heapq.heappop(pq)
+        if u in settled:
+            continue
+        settled.add(u)
+        if u == target:
+            result = distances[u]
+            break
+
+        for v, weight in graph.get_neighbors(u):
+            new_dist = distances[u] + weight
+            if v not in distances or new_dist < distances[v]:
+                distances[v] = new_dist
+                heapq.heappush(pq, (new_dist + h(v), v))
+
+    if stats is not None:
+        stats["settled"] = stats.get("settled", 0) + len(settled)
+    return result
+
+
+# Read-only CSR graph attached from shared memory in each dijkstra_many() worker
+_shared_graph: Optional[CSRGraph] = None
+_shared_blocks: List[shared_memory.SharedMemory] = []
+
+
+def _attach_shared_csr(num_vertices: int, names: Tuple[str, str, str]):
+    """Pool initializer: wrap the shared CSR arrays without copying them"""
+    global _shared_graph
+    _shared_blocks[:] = [shared_memory.SharedMemory(name=name) for name in names]
+    indptr, indices, weights = (
+        block.buf.cast(typecode)
+        for block, typecode in zip(_shared_blocks, ("q", "i", "d"))
+    )
+    # Blocks may be rounded up in size, so cut the views to the real lengths
+    indptr = indptr[: num_vertices + 1]
+    num_entries = indptr[num_vertices]
+    graph = CSRGraph.__new__(CSRGraph)
+    graph.num_vertices = num_vertices
+    graph.directed = True
+    graph.indptr = indptr
+    graph.indices = graph._indices = indices[:num_entries]
+    graph.weights = graph._weights = weights[:num_entries]
+    graph._reverse = None
+    _shared_graph = graph
+
+
+def _dijkstra_shared(source: int) -> Tuple[int, Dict[int, float]]:
+    return source, dijkstra_csr(_shared_graph, source)
+
+
+def dijkstra_many(graph, sources: List[int], workers: Optional[int] = None):
+    """
+    Dijkstra from many sources in a process pool
+    The graph is copied once into shared memory as CSR arrays, which every
+    worker maps read-only instead of receiving a pickled copy per task.
+    Yields (source, distances) in the order of sources as results arrive.
+    If the caller stops early, sources that have not started are cancelled
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph(
+            graph.num_vertices,
+            True,
+            [
+                (u, v, weight)
+                for u in range(graph.num_vertices)
+                for v, weight in graph.get_neighbors(u)
+            ],
+        )
+
+    blocks = []
+    pool = None
+    try:
+        for data in (graph.indptr, graph.indices, graph.weights):
+            raw = data.tobytes() if isinstance(data, array) else bytes(data)
+            # Shared memory blocks cannot be empty
+            block = shared_memory.SharedMemory(create=True, size=max(len(raw), 8))
+            block.buf[: len(raw)] = raw
+            blocks.append(block)
+
+        names = tuple(block.name for block in blocks)
+        # Not a with block: its shutdown would wait for every remaining source
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_attach_shared_csr,
+            initargs=(graph.num_vertices, names),
+        )
+        chunksize = max(1, len(sources) // (4 * (workers or os.cpu_count())))
+        yield from pool.map(_dijkstra_shared, sources, chunksize=chunksize)
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
 def check_all_edges(graph, edges_to_check: List[Tuple[int, int]]) -> int:
     """
     Check existence of multiple edges
@@ -275,6 +1338,8 @@ def build_graph(
     directed: bool = False,
 ):
     """Build a graph from edge list using specified representation"""
+    if graph_class is CSRGraph:
+        return CSRGraph(num_vertices, directed, edges)
     graph = graph_class(num_vertices, directed)
     for u, v, weight in edges:
         graph.add_edge(u, v, weight)
@@ -283,32 +1348,127 @@ def build_graph(
 
 # Benchmarking Functions
 
+REPRESENTATION_CLASSES = {
+    "Edge List": EdgeList,
+    "Adjacency List": AdjacencyList,
+    "Adjacency Matrix": AdjacencyMatrix,
+    "NumPy Matrix": NumpyAdjacencyMatrix,
+    "CSR": CSRGraph,
+    "Indexed Edge List": IndexedEdgeList,
+    "Indexed Adj List": IndexedAdjacencyList,
+    "Bitset Matrix": BitsetMatrix,
+}
+
+# Indexed representation -> representation it is compared with
+INDEXED_REPRESENTATIONS = {
+    "Indexed Edge List": "Edge List",
+    "Indexed Adj List": "Adjacency List",
+}
+
+# Representations that store no weights, left out of the Dijkstra row
+UNWEIGHTED_REPRESENTATIONS = {"Bitset Matrix"}
+
 
 def benchmark_construction(
-    num_vertices: int, edges: List[Tuple[int, int, float]], directed: bool = False
+    num_vertices: int,
+    edges: List[Tuple[int, int, float]],
+    directed: bool = False,
+    bulk: bool = False,
 ) -> Dict[str, float]:
-    """Benchmark graph construction time"""
+    """Benchmark graph construction time, per edge or with from_edges()"""
     results = {}
+    edge_array = np.array(edges, dtype=np.float64).reshape(-1, 3) if bulk else None
 
-    # Edge List
-    if REPRESENTATIONS_CONFIG.get("Edge List", True):
-        start = time.perf_counter()
-        edge_list = build_graph(EdgeList, num_vertices, edges, directed)
-        results["Edge List"] = time.perf_counter() - start
+    for name, graph_class in REPRESENTATION_CLASSES.items():
+        if REPRESENTATIONS_CONFIG.get(name, True):
+            start = time.perf_counter()
+            if bulk:
+                graph_class.from_edges(num_vertices, edge_array, directed)
+            else:
+                build_graph(graph_class, num_vertices, edges, directed)
+            results[name] = time.perf_counter() - start
 
-    # Adjacency List
-    if REPRESENTATIONS_CONFIG.get("Adjacency List", True):
-        start = time.perf_counter()
-        adj_list = build_graph(AdjacencyList, num_vertices, edges, directed)
-        results["Adjacency List"] = time.perf_counter() - start
+    return results
 
-    # Adjacency Matrix
-    if REPRESENTATIONS_CONFIG.get("Adjacency Matrix", True):
-        start = time.perf_counter()
-        adj_matrix = build_graph(AdjacencyMatrix, num_vertices, edges, directed)
-        results["Adjacency Matrix"] = time.perf_counter() - start
 
-    return results
+def run_construction_benchmark(
+    num_vertices: int = 100_000,
+    num_edges: int = 1_000_000,
+    directed: bool = False,
+    max_matrix_vertices: int = 5000,
+):
+    """
+    Compare add_edge() construction with from_edges() on a large graph
+    The matrix representations are skipped above max_matrix_vertices
+    """
+    print(f"Generating {num_edges} edges on {num_vertices} vertices...")
+    edges = generate_random_graph(num_vertices, num_edges, directed=directed)
+    skipped = {}
+    if num_vertices > max_matrix_vertices:
+        for name in ("Adjacency Matrix", "NumPy Matrix"):
+            skipped[name] = REPRESENTATIONS_CONFIG.get(name, True)
+            REPRESENTATIONS_CONFIG[name] = False
+    try:
+        per_edge = benchmark_construction(num_vertices, edges, directed)
+        bulk = benchmark_construction(num_vertices, edges, directed, bulk=True)
+    finally:
+        REPRESENTATIONS_CONFIG.update(skipped)
+
+    print(
+        f"\n{'Representation':<20} {'add_edge':>12} {'from_edges':>12} {'Speedup':>9}"
+    )
+    print(f"{'-'*56}")
+    for name in per_edge:
+        print(
+            f"{name:<20} {per_edge[name]*1000:>10.1f}ms {bulk[name]*1000:>10.1f}ms "
+            f"{per_edge[name] / bulk[name]:>8.1f}x"
+        )
+    print()
+    return {"Construction": per_edge, "Bulk Construction": bulk}
+
+
+def deep_size(obj, seen: Optional[Set[int]] = None) -> int:
+    """Approximate bytes used by obj and everything it references"""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    if isinstance(obj, np.ndarray):
+        size = sys.getsizeof(obj)
+        return size if obj.base is None else size + deep_size(obj.base, seen)
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_size(item, seen) for item in obj)
+    elif isinstance(obj, memoryview):
+        size += deep_size(obj.obj, seen)
+    elif hasattr(obj, "__dict__"):
+        size += deep_size(vars(obj), seen)
+    return size
+
+
+def benchmark_memory(
+    num_vertices: int, edges: List[Tuple[int, int, float]], directed: bool = False
+) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """
+    Benchmark memory use in bytes
+    Returns (peak traced allocation during construction, deep size of the graph)
+    """
+    peaks = {}
+    sizes = {}
+
+    for name, graph_class in REPRESENTATION_CLASSES.items():
+        if REPRESENTATIONS_CONFIG.get(name, True):
+            tracemalloc.start()
+            graph = build_graph(graph_class, num_vertices, edges, directed)
+            _, peaks[name] = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            sizes[name] = deep_size(graph)
+
+    return peaks, sizes
 
 
 def benchmark_edge_check(
@@ -351,6 +1511,27 @@ def benchmark_bfs(graphs: Dict[str, any], start_vertex: int) -> Dict[str, float]
     return results
 
 
+def benchmark_direction_optimizing_bfs(
+    graphs: Dict[str, any], start_vertex: int
+) -> Dict[str, float]:
+    """
+    Benchmark direction-optimizing BFS traversal
+    Only representations that implement it are timed; the rest would rerun bfs()
+    """
+    results = {}
+
+    for name, graph in graphs.items():
+        if not (
+            isinstance(graph, CSRGraph) or hasattr(graph, "direction_optimizing_bfs")
+        ):
+            continue
+        start = time.perf_counter()
+        direction_optimizing_bfs(graph, start_vertex)
+        results[name] = time.perf_counter() - start
+
+    return results
+
+
 def benchmark_dfs(graphs: Dict[str, any], start_vertex: int) -> Dict[str, float]:
     """Benchmark DFS traversal"""
     results = {}
@@ -404,18 +1585,16 @@ def run_comprehensive_benchmark(
     enabled_reps = [name for name, enabled in REPRESENTATIONS_CONFIG.items() if enabled]
     print(f"Building graph representations: {', '.join(enabled_reps)}...\n")
     construction_times = benchmark_construction(num_vertices, edges, directed)
+    bulk_construction_times = benchmark_construction(
+        num_vertices, edges, directed, bulk=True
+    )
+    peak_memory, memory = benchmark_memory(num_vertices, edges, directed)
 
-    graphs = {}
-    if REPRESENTATIONS_CONFIG.get("Edge List", True):
-        graphs["Edge List"] = build_graph(EdgeList, num_vertices, edges, directed)
-    if REPRESENTATIONS_CONFIG.get("Adjacency List", True):
-        graphs["Adjacency List"] = build_graph(
-            AdjacencyList, num_vertices, edges, directed
-        )
-    if REPRESENTATIONS_CONFIG.get("Adjacency Matrix", True):
-        graphs["Adjacency Matrix"] = build_graph(
-            AdjacencyMatrix, num_vertices, edges, directed
-        )
+    graphs = {
+        name: build_graph(graph_class, num_vertices, edges, directed)
+        for name, graph_class in REPRESENTATION_CLASSES.items()
+        if REPRESENTATIONS_CONFIG.get(name, True)
+    }
 
     # Generate test data
     test_edges = [
@@ -430,21 +1609,38 @@ def run_comprehensive_benchmark(
     edge_check_times = benchmark_edge_check(graphs, test_edges)
     neighbor_query_times = benchmark_neighbor_query(graphs, test_vertices)
     bfs_times = benchmark_bfs(graphs, start_vertex)
+    do_bfs_times = benchmark_direction_optimizing_bfs(graphs, start_vertex)
     dfs_times = benchmark_dfs(graphs, start_vertex)
-    dijkstra_times = benchmark_dijkstra(graphs, start_vertex)
+    dijkstra_times = benchmark_dijkstra(
+        {
+            name: graph
+            for name, graph in graphs.items()
+            if name not in UNWEIGHTED_REPRESENTATIONS
+        },
+        start_vertex,
+    )
 
     # Compile results
     all_results = {
         "Construction": construction_times,
+        "Bulk Construction": bulk_construction_times,
         "Edge Check": edge_check_times,
         "Neighbor Query": neighbor_query_times,
         "BFS": bfs_times,
+        "Direction-Opt BFS": do_bfs_times,
         "DFS": dfs_times,
         "Dijkstra": dijkstra_times,
+        "Memory": memory,
+        "Peak Memory": peak_memory,
     }
 
     # Print results
-    print_results(all_results)
+    index_memory = {
+        name: edge_index_memory(graphs[name])
+        for name in INDEXED_REPRESENTATIONS
+        if name in graphs
+    }
+    print_results(all_results, index_memory)
 
     # Visualize results
     visualize_results(all_results, num_vertices, num_edges)
@@ -452,8 +1648,357 @@ def run_comprehensive_benchmark(
     return all_results
 
 
-def print_results(results: Dict[str, Dict[str, float]]):
-    """Print benchmark results in a formatted table"""
+def run_scaling_sweep(
+    vertex_counts: Tuple[int, ...] = (100, 200, 500, 1000, 2000),
+    densities: Tuple[float, ...] = (0.001, 0.01, 0.1),
+    repeats: int = 5,
+    num_tests: int = 100,
+    directed: bool = False,
+    representations: Tuple[str, ...] = ("Adjacency List", "Adjacency Matrix"),
+):
+    """
+    Run the benchmark over a grid of vertex counts and densities
+    Density is the fraction of all possible edges that exist. Every point is
+    repeated with seeds 0..repeats-1 and summarized as median and IQR.
+    Returns {(num_vertices, density): {operation: {representation: (median, q1, q3)}}}
+    """
+    print(f"\n{'='*70}")
+    print("SCALING SWEEP")
+    print(f"{'='*70}")
+    print(f"Vertices: {list(vertex_counts)}")
+    print(f"Densities: {list(densities)}")
+    print(f"Repeats: {repeats}")
+    print(f"{'='*70}\n")
+
+    sweep = {}
+    for num_vertices in vertex_counts:
+        max_edges = num_vertices * (num_vertices - 1)
+        if not directed:
+            max_edges //= 2
+        for density in densities:
+            num_edges = max(1, int(density * max_edges))
+            runs = defaultdict(lambda: defaultdict(list))
+            for seed in range(repeats):
+                random.seed(seed)
+                edges = generate_random_graph(
+                    num_vertices, num_edges, directed=directed
+                )
+                graphs = {}
+                for name in representations:
+                    start = time.perf_counter()
+                    graphs[name] = build_graph(
+                        REPRESENTATION_CLASSES[name], num_vertices, edges, directed
+                    )
+                    runs["Construction"][name].append(time.perf_counter() - start)
+
+                test_edges = [
+                    (
+                        random.randint(0, num_vertices - 1),
+                        random.randint(0, num_vertices - 1),
+                    )
+                    for _ in range(num_tests)
+                ]
+                test_vertices = [
+                    random.randint(0, num_vertices - 1) for _ in range(num_tests)
+                ]
+                start_vertex = random.randint(0, num_vertices - 1)
+                for operation, times in (
+                    ("Edge Check", benchmark_edge_check(graphs, test_edges)),
+                    ("Neighbor Query", benchmark_neighbor_query(graphs, test_vertices)),
+                    ("BFS", benchmark_bfs(graphs, start_vertex)),
+                    ("DFS", benchmark_dfs(graphs, start_vertex)),
+                    ("Dijkstra", benchmark_dijkstra(graphs, start_vertex)),
+                ):
+                    for name, elapsed in times.items():
+                        runs[operation][name].append(elapsed)
+
+            sweep[(num_vertices, density)] = {
+                operation: {
+                    name: tuple(np.percentile(values, [50, 25, 75]).tolist())
+                    for name, values in times.items()
+                }
+                for operation, times in runs.items()
+            }
+            print(f"{num_vertices} vertices, {num_edges} edges (density {density}):")
+            for operation, times in sweep[(num_vertices, density)].items():
+                line = f"  {operation:<16}"
+                for name, (median, q1, q3) in times.items():
+                    line += f" {name}: {median*1000:.4f}ms (IQR {(q3 - q1)*1000:.4f})"
+                print(line)
+
+    visualize_sweep(sweep, vertex_counts, densities, representations)
+    return sweep
+
+
+def visualize_sweep(sweep, vertex_counts, densities, representations):
+    """Plot median time against vertex count per operation on log-log axes"""
+    operations = list(next(iter(sweep.values())).keys())
+    num_rows = (len(operations) + 2) // 3
+    fig, axes = plt.subplots(num_rows, 3, figsize=(18, 5 * num_rows), squeeze=False)
+    fig.suptitle(
+        "Graph Representation Scaling (median with IQR band)",
+        fontsize=16,
+        fontweight="bold",
+    )
+    line_styles = ["-", "--", ":", "-."]
+    color_palette = ["#E63946", "#06AED5", "#F77F00", "#06D6A0", "#9D4EDD"]
+
+    for idx, operation in enumerate(operations):
+        ax = axes[idx // 3, idx % 3]
+        for rep_idx, rep in enumerate(representations):
+            for density_idx, density in enumerate(densities):
+                stats = [sweep[(n, density)][operation][rep] for n in vertex_counts]
+                medians = [median * 1000 for median, _, _ in stats]
+                ax.plot(
+                    vertex_counts,
+                    medians,
+                    marker="o",
+                    color=color_palette[rep_idx % len(color_palette)],
+                    linestyle=line_styles[density_idx % len(line_styles)],
+                    label=f"{rep}, density {density}",
+                )
+                ax.fill_between(
+                    vertex_counts,
+                    [q1 * 1000 for _, q1, _ in stats],
+                    [q3 * 1000 for _, _, q3 in stats],
+                    color=color_palette[rep_idx % len(color_palette)],
+                    alpha=0.15,
+                )
+        ax.set_xscale("log")
+        ax.set_yscale("log")
+        ax.set_xlabel("Vertices", fontweight="bold")
+        ax.set_ylabel("Time (ms)", fontweight="bold")
+        ax.set_title(operation, fontweight="bold", fontsize=12)
+        ax.grid(alpha=0.3, linestyle="--", which="both")
+    axes[0, 0].legend(fontsize=8)
+
+    # Hide unused subplots
+    for idx in range(len(operations), num_rows * 3):
+        axes[idx // 3, idx % 3].axis("off")
+
+    plt.tight_layout()
+    output = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "scaling_sweep.png"
+    )
+    plt.savefig(output, dpi=300, bbox_inches="tight")
+    print(f"Scaling sweep saved to: {output}\n")
+    plt.show()
+
+
+def run_bitset_benchmark(
+    num_vertices: int = 20_000,
+    num_edges: int = 2_000_000,
+    directed: bool = False,
+    representations: Tuple[str, ...] = ("Adjacency List", "CSR", "Bitset Matrix"),
+):
+    """
+    Compare memory and BFS throughput on a large, fairly dense graph
+    Graphs are built with from_edges(); throughput counts edges scanned per second
+    """
+    print(f"Generating {num_edges} edges on {num_vertices} vertices...")
+    edges = generate_random_graph(num_vertices, num_edges, directed=directed)
+    edge_array = np.array(edges, dtype=np.float64)
+    start_vertex = random.randint(0, num_vertices - 1)
+    num_entries = num_edges if directed else 2 * num_edges
+
+    print(f"\n{'Representation':<20} {'Memory':>12} {'BFS':>12} {'Edges/s':>14}")
+    print(f"{'-'*61}")
+    results = {}
+    for name in representations:
+        graph = REPRESENTATION_CLASSES[name].from_edges(
+            num_vertices, edge_array, directed
+        )
+        memory = deep_size(graph)
+        start = time.perf_counter()
+        bfs(graph, start_vertex)
+        elapsed = time.perf_counter() - start
+        results[name] = {"Memory": memory, "BFS": elapsed}
+        print(
+            f"{name:<20} {memory / 1e6:>10.1f}MB {elapsed*1000:>10.1f}ms "
+            f"{num_entries / elapsed:>14.3e}"
+        )
+    print()
+    return results
+
+
+def run_dijkstra_benchmark(
+    num_vertices: int = 5000,
+    num_edges: int = 20000,
+    num_queries: int = 50,
+    directed: bool = False,
+):
+    """
+    Compare lazy-deletion Dijkstra with the indexed heap and bidirectional search
+    Full single-source runs and point-to-point queries on an AdjacencyList
+    built from generate_random_graph; reports time and heap operations
+    """
+    edges = generate_random_graph(num_vertices, num_edges, directed=directed)
+    graph = build_graph(AdjacencyList, num_vertices, edges, directed)
+    reverse = reverse_graph(graph)
+    start_vertex = random.randint(0, num_vertices - 1)
+    queries = [
+        (random.randint(0, num_vertices - 1), random.randint(0, num_vertices - 1))
+        for _ in range(num_queries)
+    ]
+
+    variants = {
+        "Lazy (full)": lambda stats: [dijkstra(graph, start_vertex, stats=stats)],
+        "Indexed (full)": lambda stats: [
+            dijkstra_indexed(graph, start_vertex, stats=stats)
+        ],
+        "Lazy (target)": lambda stats: [
+            dijkstra(graph, s, t, stats).get(t, float("inf")) for s, t in queries
+        ],
+        "Indexed (target)": lambda stats: [
+            dijkstra_indexed(graph, s, t, stats).get(t, float("inf"))
+            for s, t in queries
+        ],
+        "Bidirectional": lambda stats: [
+            bidirectional_dijkstra(graph, s, t, reverse, stats) for s, t in queries
+        ],
+    }
+
+    print(
+        f"\n{'Variant':<18} {'Time':>12} {'Push':>9} {'Pop':>9} {'Decrease':>9} {'Settled':>9}"
+    )
+    print(f"{'-'*72}")
+    results = {}
+    answers = {}
+    for name, run in variants.items():
+        stats = {}
+        start = time.perf_counter()
+        answers[name] = run(stats)
+        elapsed = time.perf_counter() - start
+        results[name] = {"time": elapsed, **stats}
+        print(
+            f"{name:<18} {elapsed*1000:>10.2f}ms {stats.get('push', 0):>9} "
+            f"{stats.get('pop', 0):>9} {stats.get('decrease_key', 0):>9} "
+            f"{stats.get('settled', 0):>9}"
+        )
+    print(f"{'-'*72}")
+
+    same_full = answers["Lazy (full)"] == answers["Indexed (full)"]
+    same_queries = all(
+        abs(a - b) < 1e-9 and abs(a - c) < 1e-9
+        for a, b, c in zip(
+            answers["Lazy (target)"],
+            answers["Indexed (target)"],
+            answers["Bidirectional"],
+        )
+        if a != float("inf")
+    )
+    print(f"Same distances: full {same_full}, point-to-point {same_queries}\n")
+    return results
+
+
+def run_dijkstra_many_benchmark(
+    num_vertices: int = 10_000,
+    num_edges: int = 50_000,
+    num_sources: int = 1000,
+    worker_counts: Optional[List[int]] = None,
+    directed: bool = False,
+):
+    """
+    Report aggregate sources/second of dijkstra_many() as workers scale
+    from 1 to all cores
+    """
+    edges = generate_random_graph(num_vertices, num_edges, directed=directed)
+    graph = build_graph(CSRGraph, num_vertices, edges, directed)
+    sources = [random.randint(0, num_vertices - 1) for _ in range(num_sources)]
+    if worker_counts is None:
+        cores = os.cpu_count()
+        worker_counts = sorted({1, cores} | {2**i for i in range(cores.bit_length())})
+        worker_counts = [count for count in worker_counts if count <= cores]
+
+    print(f"\n{'Workers':<10} {'Time':>10} {'Sources/s':>12} {'Speedup':>9}")
+    print(f"{'-'*44}")
+    results = {}
+    for workers in worker_counts:
+        start = time.perf_counter()
+        for _ in dijkstra_many(graph, sources, workers=workers):
+            pass
+        elapsed = time.perf_counter() - start
+        results[workers] = num_sources / elapsed
+        print(
+            f"{workers:<10} {elapsed:>9.2f}s {results[workers]:>12.1f} "
+            f"{results[workers] / results[worker_counts[0]]:>8.2f}x"
+        )
+    print()
+    return results
+
+
+def run_alt_benchmark(
+    num_vertices: int = 5000,
+    num_edges: int = 20000,
+    num_landmarks: int = 8,
+    num_queries: int = 100,
+    directed: bool = False,
+):
+    """
+    Compare settled vertices and latency of ALT A* queries against dijkstra()
+    with early exit on the same random graph
+    """
+    edges = generate_random_graph(num_vertices, num_edges, directed=directed)
+    graph = build_graph(AdjacencyList, num_vertices, edges, directed)
+    queries = [
+        (random.randint(0, num_vertices - 1), random.randint(0, num_vertices - 1))
+        for _ in range(num_queries)
+    ]
+
+    start = time.perf_counter()
+    landmarks = Landmarks(graph, num_landmarks)
+    preprocessing = time.perf_counter() - start
+    landmark_bytes = sys.getsizeof(landmarks.from_landmark) + sys.getsizeof(
+        landmarks.to_landmark
+    )
+    print(
+        f"\nALT preprocessing: {len(landmarks.vertices)} landmarks in "
+        f"{preprocessing:.2f}s, {landmark_bytes / 1e6:.2f} MB"
+    )
+
+    results = {}
+    answers = {}
+    for name, query in (
+        (
+            "Dijkstra",
+            lambda s, t, stats: dijkstra(graph, s, t, stats).get(t, float("inf")),
+        ),
+        ("ALT A*", lambda s, t, stats: astar(graph, s, t, landmarks, stats)),
+    ):
+        stats = {}
+        start = time.perf_counter()
+        answers[name] = [query(s, t, stats) for s, t in queries]
+        elapsed = time.perf_counter() - start
+        results[name] = {
+            "latency": elapsed / num_queries,
+            "settled": stats["settled"] / num_queries,
+        }
+
+    print(f"{'Query':<12} {'Latency':>12} {'Settled':>10}")
+    print(f"{'-'*36}")
+    for name, result in results.items():
+        print(
+            f"{name:<12} {result['latency']*1000:>10.3f}ms {result['settled']:>10.1f}"
+        )
+    same = all(
+        a == b or abs(a - b) < 1e-9
+        for a, b in zip(answers["Dijkstra"], answers["ALT A*"])
+    )
+    print(f"Same distances: {same}\n")
+    return results
+
+
+# Rows of all_results measured in bytes rather than seconds
+MEMORY_OPERATIONS = {"Memory", "Peak Memory"}
+
+
+def print_results(
+    results: Dict[str, Dict[str, float]], index_memory: Optional[Dict[str, int]] = None
+):
+    """
+    Print benchmark results in a formatted table
+    index_memory maps indexed representations to the bytes used by their edge index
+    """
     # Get enabled representations
     representations = [
         name for name, enabled in REPRESENTATIONS_CONFIG.items() if enabled
@@ -476,12 +2021,18 @@ def print_results(results: Dict[str, Dict[str, float]]):
     for operation, times in results.items():
         line = f"{operation:<20} "
 
-        # Add times for each enabled representation
+        # Add times (or sizes) for each enabled representation
         for rep in representations:
-            time_ms = times.get(rep, float("inf"))
-            line += f"{time_ms*1000:>12.4f}ms "
-
-        # Find winner (lowest time)
+            if rep not in times:
+                line += f"{'n/a':>14} "
+            elif operation in MEMORY_OPERATIONS:
+                size_mb = times[rep] / 1e6
+                line += f"{size_mb:>12.4f}MB "
+            else:
+                time_ms = times[rep]
+                line += f"{time_ms*1000:>12.4f}ms "
+
+        # Find winner (lowest time or size)
         if times:
             winner = min(times.items(), key=lambda x: x[1])[0]
             line += f"{winner:<15}"
@@ -490,6 +2041,19 @@ def print_results(results: Dict[str, Dict[str, float]]):
 
     print(f"{'-'*80}\n")
 
+    # Edge index speedup and its memory cost
+    edge_check = results.get("Edge Check", {})
+    for name, memory in (index_memory or {}).items():
+        base = INDEXED_REPRESENTATIONS[name]
+        if name in edge_check and base in edge_check:
+            speedup = edge_check[base] / edge_check[name]
+            print(
+                f"{name}: edge check {speedup:.1f}x faster than {base}, "
+                f"index uses {memory / 1024:.1f} KB"
+            )
+    if index_memory:
+        print()
+
 
 def visualize_results(
     results: Dict[str, Dict[str, float]], num_vertices: int, num_edges: int
@@ -507,8 +2071,9 @@ def visualize_results(
 
     operations = list(results.keys())
 
-    # Create figure with subplots
-    fig, axes = plt.subplots(2, 3, figsize=(18, 10))
+    # Create figure with subplots, three per row
+    num_rows = (len(operations) + 2) // 3
+    fig, axes = plt.subplots(num_rows, 3, figsize=(18, 5 * num_rows), squeeze=False)
     fig.suptitle(
         f"Graph Representation Performance Comparison\n"
         f"({num_vertices} vertices, {num_edges} edges)",
@@ -529,7 +2094,7 @@ def visualize_results(
         "#118AB2",  # Blue
     ]
     # Select colors based on number of enabled representations
-    colors = color_palette[: len(representations)]
+    colors = dict(zip(representations, color_palette))
 
     # Individual operation plots
     for idx, (operation, times) in enumerate(results.items()):
@@ -537,11 +2102,16 @@ def visualize_results(
         col = idx % 3
         ax = axes[row, col]
 
-        values = [times[rep] * 1000 for rep in representations]  # Convert to ms
+        # Some rows leave representations out (e.g. Dijkstra without weights)
+        shown = [rep for rep in representations if rep in times]
+        if operation in MEMORY_OPERATIONS:
+            values = [times[rep] / 1e6 for rep in shown]  # Convert to MB
+        else:
+            values = [times[rep] * 1000 for rep in shown]  # Convert to ms
         bars = ax.bar(
-            range(len(representations)),
+            range(len(shown)),
             values,
-            color=colors,
+            color=[colors[rep] for rep in shown],
             alpha=0.8,
             edgecolor="black",
             linewidth=1.5,
@@ -560,10 +2130,11 @@ def visualize_results(
                 fontweight="bold",
             )
 
-        ax.set_ylabel("Time (ms)", fontweight="bold")
+        unit = "Memory (MB)" if operation in MEMORY_OPERATIONS else "Time (ms)"
+        ax.set_ylabel(unit, fontweight="bold")
         ax.set_title(operation, fontweight="bold", fontsize=12)
-        ax.set_xticks(range(len(representations)))
-        ax.set_xticklabels(representations, rotation=15, ha="right")
+        ax.set_xticks(range(len(shown)))
+        ax.set_xticklabels(shown, rotation=15, ha="right")
         ax.grid(axis="y", alpha=0.3, linestyle="--")
 
         # Highlight the winner (lowest bar) with a star
@@ -578,6 +2149,10 @@ def visualize_results(
             markeredgewidth=1.5,
         )
 
+    # Hide unused subplots
+    for idx in range(len(operations), num_rows * 3):
+        axes[idx // 3, idx % 3].axis("off")
+
     plt.tight_layout()
     plt.savefig(
         "/Users/andersbekkevard/dev/python/school/algdat/graph/benchmark_results.png",
@@ -587,7 +2162,8 @@ def visualize_results(
     print(f"Visualization saved to: graph/benchmark_results.png\n")
     plt.show()
 
-    # Create a summary comparison chart
+    # Create a summary comparison chart of the timed operations
+    operations = [op for op in operations if op not in MEMORY_OPERATIONS]
     fig, ax = plt.subplots(figsize=(14, 8))
 
     x = np.arange(len(operations))
@@ -596,14 +2172,14 @@ def visualize_results(
     width = 0.8 / num_reps if num_reps > 0 else 0.25
 
     for idx, rep in enumerate(representations):
-        values = [results[op][rep] * 1000 for op in operations]
+        values = [results[op].get(rep, np.nan) * 1000 for op in operations]
         offset = (idx - num_reps / 2 + 0.5) * width
         bars = ax.bar(
             x + offset,
             values,
             width,
             label=rep,
-            color=colors[idx],
+            color=colors[rep],
             alpha=0.8,
             edgecolor="black",
             linewidth=1.5,
@@ -659,11 +2235,17 @@ def demo_usage():
     edge_list = build_graph(EdgeList, num_vertices, edges)
     adj_list = build_graph(AdjacencyList, num_vertices, edges)
     adj_matrix = build_graph(AdjacencyMatrix, num_vertices, edges)
+    numpy_matrix = build_graph(NumpyAdjacencyMatrix, num_vertices, edges)
+    csr = build_graph(CSRGraph, num_vertices, edges)
+    bitset = build_graph(BitsetMatrix, num_vertices, edges)
 
     graphs = {
         "Edge List": edge_list,
         "Adjacency List": adj_list,
         "Adjacency Matrix": adj_matrix,
+        "NumPy Matrix": numpy_matrix,
+        "CSR": csr,
+        "Bitset Matrix": bitset,
     }
 
     # Test operations
@@ -718,6 +2300,30 @@ if __name__ == "__main__":
     print("\n### LARGE SPARSE GRAPH ###")
     run_comprehensive_benchmark(num_vertices=1000, num_edges=5000, num_tests=100)
 
+    # Scaling sweep
+    print("\n### SCALING SWEEP ###")
+    run_scaling_sweep()
+
+    # Dense graph at 20k vertices
+    print("\n### BITSET MATRIX (20K VERTICES) ###")
+    run_bitset_benchmark()
+
+    # Dijkstra variants
+    print("\n### DIJKSTRA VARIANTS ###")
+    run_dijkstra_benchmark()
+
+    # Multi-source shortest paths
+    print("\n### MULTI-SOURCE DIJKSTRA ###")
+    run_dijkstra_many_benchmark()
+
+    # ALT point-to-point queries
+    print("\n### ALT A* QUERIES ###")
+    run_alt_benchmark()
+
+    # Bulk construction at scale
+    print("\n### BULK CONSTRUCTION (10^6 EDGES) ###")
+    run_construction_benchmark(num_vertices=100_000, num_edges=1_000_000)
+
     print("\n" + "=" * 70)
     print("ALL BENCHMARKS COMPLETED!")
     print("=" * 70 + "\n")
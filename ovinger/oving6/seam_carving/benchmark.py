@@ -0,0 +1,184 @@
+"""Compare the seam finders in seam_carving.py and test.py.
+
+Every implementation runs on random weight matrices of increasing size and on
+the weights of tower.jpg. The cost of each returned path is checked against
+find_path_njit(), and the best untraced time and the peak traced memory are
+written to benchmark_results.csv and benchmark_results.json.
+
+benchmark_tiled() plots the speedup of the parallel tiled DP over the serial
+one on very wide matrices.
+"""
+
+from PIL import Image
+from numba import get_num_threads, set_num_threads
+import matplotlib.pyplot as plt
+import numpy as np
+import csv
+import json
+import time
+import tracemalloc
+
+import seam_carving
+import test
+
+current_dir = seam_carving.current_dir
+sizes = [100, 250, 500, 1000, 2000, 4000]
+# The pure Python implementations take minutes on the largest matrices
+max_python_size = 1000
+output_name = "benchmark_results"
+
+
+def path_cost(weights, path):
+    return int(sum(weights[row][column] for column, row in path))
+
+
+# name -> (function, takes a list of lists, returns the minimum cost instead of a path)
+IMPLEMENTATIONS = {
+    "find_path_old": (seam_carving.find_path_old, True, False),
+    "find_path_njit": (seam_carving.find_path_njit, False, False),
+    "find_path_lowmem_njit": (seam_carving.find_path_lowmem_njit, False, False),
+    "find_path_tiled": (seam_carving.find_path_tiled, False, False),
+    "find_path": (seam_carving.find_path, False, False),
+    "test.find_path": (test.find_path, True, False),
+    "test.find_min_iterative": (test.find_min_iterative, True, True),
+}
+
+
+def measure(function, weights, repeats=3):
+    """Run function, returning (result, seconds, peak bytes traced).
+
+    tracemalloc slows down allocation-heavy code a lot, so the traced run is
+    only used for the peak memory (and doubles as warmup). The time is the
+    best of repeats untraced runs.
+    """
+    tracemalloc.start()
+    result = function(weights)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    elapsed = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function(weights)
+        elapsed = min(elapsed, time.perf_counter() - start)
+    return result, elapsed, peak
+
+
+def benchmark_weights(name, weights):
+    """Run every implementation on one weight matrix"""
+    expected = path_cost(weights, seam_carving.find_path_njit(weights))
+    as_list = None
+    rows = []
+    for implementation, (function, uses_list, returns_cost) in IMPLEMENTATIONS.items():
+        if uses_list and max(weights.shape) > max_python_size:
+            continue
+        if uses_list and as_list is None:
+            as_list = weights.tolist()
+        result, elapsed, peak = measure(function, as_list if uses_list else weights)
+        cost = int(result) if returns_cost else path_cost(weights, result)
+        rows.append(
+            {
+                "input": name,
+                "height": weights.shape[0],
+                "width": weights.shape[1],
+                "implementation": implementation,
+                "seconds": elapsed,
+                "peak_bytes": peak,
+                "cost": cost,
+                "cost_matches": cost == expected,
+            }
+        )
+        print(
+            f"{name:>12} {implementation:>24} {elapsed:10.4f}s "
+            f"{peak / 1e6:10.2f} MB {'ok' if cost == expected else 'COST MISMATCH'}"
+        )
+    return rows
+
+
+def run_benchmark(seed=0):
+    # Compile the njit functions before anything is timed
+    warmup = np.arange(12, dtype=np.int64).reshape(3, 4)
+    for function, uses_list, _ in IMPLEMENTATIONS.values():
+        if not uses_list:
+            function(warmup)
+
+    rng = np.random.default_rng(seed)
+    rows = []
+    for size in sizes:
+        weights = rng.integers(0, 765, (size, size), dtype=np.int64)
+        rows += benchmark_weights(f"random {size}", weights)
+    image = Image.open(current_dir / seam_carving.image_name)
+    weights = seam_carving.get_weights_array(seam_carving.image_to_array(image))
+    rows += benchmark_weights(seam_carving.image_name, weights)
+    return rows
+
+
+def save_results(rows):
+    with open(current_dir / f"{output_name}.csv", "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    with open(current_dir / f"{output_name}.json", "w") as file:
+        json.dump(rows, file, indent=2)
+
+
+def benchmark_tiled(widths=(1000, 2500, 5000, 10000), height=1000, repeats=3, seed=0):
+    """Speedup of build_memo_tiled_njit() over build_memo_njit() per thread count.
+
+    Checks that both tables are identical and saves the graph as
+    benchmark_tiled.png.
+    """
+    max_threads = get_num_threads()
+    threads = sorted({1, 2, 4, 8, max_threads} & set(range(1, max_threads + 1)))
+    rng = np.random.default_rng(seed)
+    warmup = np.arange(12, dtype=np.int64).reshape(3, 4)
+    seam_carving.build_memo_njit(warmup)
+    seam_carving.build_memo_tiled_njit(warmup, 2)
+
+    def best_time(function, weights):
+        elapsed = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = function(weights)
+            elapsed = min(elapsed, time.perf_counter() - start)
+        return result, elapsed
+
+    speedups = {n_threads: [] for n_threads in threads}
+    for width in widths:
+        weights = rng.integers(0, 765, (height, width), dtype=np.int64)
+        serial, serial_time = best_time(seam_carving.build_memo_njit, weights)
+        for n_threads in threads:
+            set_num_threads(n_threads)
+            stripe = seam_carving.tiled_stripe(width)
+            tiled, tiled_time = best_time(
+                lambda weights: seam_carving.build_memo_tiled_njit(weights, stripe),
+                weights,
+            )
+            speedups[n_threads].append(serial_time / tiled_time)
+            print(
+                f"{width:>6} wide, {n_threads:>2} threads: {tiled_time:8.4f}s "
+                f"({serial_time / tiled_time:.2f}x, "
+                f"identical: {np.array_equal(serial, tiled)})"
+            )
+    set_num_threads(max_threads)
+
+    fig, ax = plt.subplots(figsize=(8, 5))
+    for n_threads, values in speedups.items():
+        ax.plot(widths, values, marker="o", label=f"{n_threads} threads")
+    ax.axhline(1, color="gray", linestyle="--", linewidth=1)
+    ax.set_xlabel("Width (pixels)")
+    ax.set_ylabel("Speedup over build_memo_njit")
+    ax.set_title(f"Tiled DP speedup, height {height}")
+    ax.legend()
+    plt.tight_layout()
+    plt.savefig(current_dir / "benchmark_tiled.png", dpi=150)
+    plt.close(fig)
+    return speedups
+
+
+if __name__ == "__main__":
+    results = run_benchmark()
+    save_results(results)
+    benchmark_tiled()
+    if not all(row["cost_matches"] for row in results):
+        raise SystemExit("Some implementations returned a more expensive path")
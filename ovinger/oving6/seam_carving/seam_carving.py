@@ -1,11 +1,20 @@
 from PIL import Image, ImageFilter
 import numpy as np
-from numba import njit
+from numba import njit, prange, get_num_threads, set_num_threads
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import argparse
+import glob
+import os
+import subprocess
+import sys
+import tempfile
+import time
 
 current_dir = Path(__file__).parent
 image_name = "tower.jpg"
 row_reduction = 200
+run_benchmark = False
 
 
 def find_path_old(weights):
@@ -54,14 +63,22 @@ def find_path_old(weights):
     return path
 
 
-@njit
-def find_path_njit(weights):
+@njit(cache=True)
+def find_path_njit(weights, forward=False):
+    """Cheapest vertical seam of weights.
+
+    With forward=True, weights is an intensity map and the seam is found
+    with the forward energy DP in find_path_forward_njit().
+    """
     n = weights.shape[0]
     m = weights.shape[1]
 
     if n == 0 or m == 0:
         return np.empty((0, 2), dtype=np.int64)
 
+    if forward:
+        return find_path_forward_njit(weights)
+
     if n == 1:
         min_idx = np.argmin(weights[0])
         return np.array([[min_idx, 0]], dtype=np.int64)
@@ -73,6 +90,15 @@ def find_path_njit(weights):
             path[i, 1] = i
         return path
 
+    memo = build_memo_njit(weights)
+    return trace_path_njit(memo)
+
+
+@njit(cache=True)
+def build_memo_njit(weights):
+    n = weights.shape[0]
+    m = weights.shape[1]
+
     # Create memo table
     memo = np.zeros((n, m), dtype=weights.dtype)
     memo[0, :] = weights[0, :]
@@ -87,6 +113,58 @@ def find_path_njit(weights):
                 path_cost = min(path_cost, memo[i - 1, j + 1])
             memo[i, j] = weights[i, j] + path_cost
 
+    return memo
+
+
+@njit(parallel=True, cache=True)
+def build_memo_tiled_njit(weights, stripe, block_rows=64):
+    """build_memo_njit() computed in column stripes of width stripe in parallel.
+
+    Use tiled_stripe() for a stripe width that fits the thread count; it is
+    not queried here, since that would keep the kernel out of the cache.
+
+    Rows are processed in blocks of block_rows. For each block every stripe
+    copies the row above the block, widened by a halo of block_rows columns
+    on each side, and runs the DP on that private buffer. Wrong values at
+    the buffer edges move inwards one column per row, so they never reach
+    the stripe itself and the stripes only have to synchronise once per
+    block. The table is identical to build_memo_njit().
+    """
+    n = weights.shape[0]
+    m = weights.shape[1]
+    memo = np.empty((n, m), dtype=weights.dtype)
+    memo[0, :] = weights[0, :]
+    n_stripes = (m + stripe - 1) // stripe
+
+    for r0 in range(1, n, block_rows):
+        r1 = min(r0 + block_rows, n)
+        depth = r1 - r0
+        for s in prange(n_stripes):
+            lo = s * stripe
+            hi = min(lo + stripe, m)
+            a = max(lo - depth, 0)
+            b = min(hi + depth, m)
+            previous = memo[r0 - 1, a:b].copy()
+            current = np.empty_like(previous)
+            for i in range(r0, r1):
+                for k in range(b - a):
+                    path_cost = previous[k]
+                    if k > 0:
+                        path_cost = min(path_cost, previous[k - 1])
+                    if k < b - a - 1:
+                        path_cost = min(path_cost, previous[k + 1])
+                    current[k] = weights[i, a + k] + path_cost
+                memo[i, lo:hi] = current[lo - a : hi - a]
+                previous, current = current, previous
+
+    return memo
+
+
+@njit(cache=True)
+def trace_path_njit(memo):
+    n = memo.shape[0]
+    m = memo.shape[1]
+
     # Building the path
     path = np.empty((n, 2), dtype=np.int64)
     j = np.argmin(memo[n - 1])
@@ -110,6 +188,350 @@ def find_path_njit(weights):
     return path
 
 
+@njit(cache=True)
+def find_path_forward_njit(intensity):
+    """Seam with the least forward energy, i.e. the least new edge energy.
+
+    Removing pixel (i, j) joins its left and right neighbours, which costs
+    C_U = |I(i, j+1) - I(i, j-1)|. Coming from (i-1, j-1) additionally joins
+    I(i-1, j) with I(i, j-1) (C_L), and from (i-1, j+1) I(i-1, j) with
+    I(i, j+1) (C_R). Since the cost depends on the step taken, the choice
+    per cell is stored and traced instead of comparing memo values.
+    """
+    n = intensity.shape[0]
+    m = intensity.shape[1]
+    memo = np.empty((n, m), dtype=np.int64)
+    choice = np.zeros((n, m), dtype=np.int8)
+    for i in range(n):
+        for j in range(m):
+            left = np.int64(intensity[i, max(j - 1, 0)])
+            right = np.int64(intensity[i, min(j + 1, m - 1)])
+            cost_up = abs(right - left)
+            if i == 0:
+                memo[i, j] = cost_up
+                continue
+            up = np.int64(intensity[i - 1, j])
+            best = memo[i - 1, j] + cost_up
+            if j > 0:
+                cost = memo[i - 1, j - 1] + cost_up + abs(up - left)
+                if cost < best:
+                    best = cost
+                    choice[i, j] = -1
+            if j < m - 1:
+                cost = memo[i - 1, j + 1] + cost_up + abs(up - right)
+                if cost < best:
+                    best = cost
+                    choice[i, j] = 1
+            memo[i, j] = best
+
+    path = np.empty((n, 2), dtype=np.int64)
+    j = np.argmin(memo[n - 1])
+    for i in range(n - 1, -1, -1):
+        path[i, 0] = j
+        path[i, 1] = i
+        j += choice[i, j]
+    return path
+
+
+def tiled_stripe(width, block_rows=64):
+    """Stripe width for build_memo_tiled_njit() splitting width over the threads.
+
+    Stripes are kept at least 4 * block_rows wide so the halos (block_rows
+    columns on each side) stay small next to the stripe.
+    """
+    threads = get_num_threads()
+    return max((width + threads - 1) // threads, 4 * block_rows)
+
+
+def find_path_tiled(weights, stripe=0, block_rows=64):
+    """find_path_njit() with the memo table from build_memo_tiled_njit().
+
+    stripe=0 picks the width with tiled_stripe().
+    """
+    if weights.shape[0] < 2 or weights.shape[1] < 2:
+        return find_path_njit(weights)
+    if stripe <= 0:
+        stripe = tiled_stripe(weights.shape[1], block_rows)
+    return trace_path_njit(build_memo_tiled_njit(weights, stripe, block_rows))
+
+
+@njit(cache=True)
+def find_path_lowmem_njit(weights):
+    """find_path_njit() with two cost rows and 2-bit backpointers.
+
+    Instead of the n x m memo table, each cell stores which neighbour in the
+    row above was cheapest (0: same column, 1: left, 2: right), four cells
+    per byte. Ties are broken like trace_path_njit(), so the path is
+    identical.
+    """
+    n = weights.shape[0]
+    m = weights.shape[1]
+
+    if n == 0 or m == 0:
+        return np.empty((0, 2), dtype=np.int64)
+
+    previous = np.empty(m, dtype=weights.dtype)
+    previous[:] = weights[0, :]
+    current = np.empty(m, dtype=weights.dtype)
+    backpointers = np.zeros((n, (m + 3) // 4), dtype=np.uint8)
+
+    for i in range(1, n):
+        for j in range(m):
+            best = previous[j]
+            choice = 0
+            if j > 0 and previous[j - 1] < best:
+                best = previous[j - 1]
+                choice = 1
+            if j < m - 1 and previous[j + 1] < best:
+                best = previous[j + 1]
+                choice = 2
+            current[j] = weights[i, j] + best
+            backpointers[i, j >> 2] |= choice << ((j & 3) * 2)
+        previous, current = current, previous
+
+    path = np.empty((n, 2), dtype=np.int64)
+    j = np.argmin(previous)
+    for i in range(n - 1, -1, -1):
+        path[i, 0] = j
+        path[i, 1] = i
+        choice = (backpointers[i, j >> 2] >> ((j & 3) * 2)) & 3
+        if choice == 1:
+            j -= 1
+        elif choice == 2:
+            j += 1
+    return path
+
+
+@njit(cache=True)
+def find_path_banded_njit(weights, center, radius):
+    """Cheapest seam that stays within radius columns of another seam.
+
+    center holds one column per row, like the first column of a path. Only
+    the 2 * radius + 1 columns around it are searched, so the cost is
+    O(n * radius) instead of O(n * m). Ties are broken like
+    trace_path_njit().
+    """
+    n = weights.shape[0]
+    m = weights.shape[1]
+    band = 2 * radius + 1
+    memo = np.zeros((n, band), dtype=weights.dtype)
+    valid = np.zeros((n, band), dtype=np.bool_)
+
+    for i in range(n):
+        lo = center[i] - radius
+        previous_lo = center[i - 1] - radius if i > 0 else 0
+        for k in range(band):
+            j = lo + k
+            if j < 0 or j >= m:
+                continue
+            if i == 0:
+                memo[i, k] = weights[i, j]
+                valid[i, k] = True
+                continue
+            found = False
+            best = memo[i, k]
+            for c in (j, j - 1, j + 1):
+                kk = c - previous_lo
+                if c < 0 or c >= m or kk < 0 or kk >= band or not valid[i - 1, kk]:
+                    continue
+                if not found or memo[i - 1, kk] < best:
+                    best = memo[i - 1, kk]
+                    found = True
+            if found:
+                memo[i, k] = weights[i, j] + best
+                valid[i, k] = True
+
+    path = np.empty((n, 2), dtype=np.int64)
+    lo = center[n - 1] - radius
+    k = -1
+    for kk in range(band):
+        if valid[n - 1, kk] and (k == -1 or memo[n - 1, kk] < memo[n - 1, k]):
+            k = kk
+    j = lo + k
+    path[n - 1, 0] = j
+    path[n - 1, 1] = n - 1
+
+    for i in range(n - 2, -1, -1):
+        lo = center[i] - radius
+        next_j = -1
+        for c in (j, j - 1, j + 1):
+            kk = c - lo
+            if c < 0 or c >= m or kk < 0 or kk >= band or not valid[i, kk]:
+                continue
+            if next_j == -1 or memo[i, kk] < memo[i, next_j - lo]:
+                next_j = c
+        j = next_j
+        path[i, 0] = j
+        path[i, 1] = i
+
+    return path
+
+
+@njit(cache=True)
+def trace_paths_njit(memo, n_paths):
+    """Trace up to n_paths non-overlapping seams from one memo table.
+
+    Seams are started from the cheapest bottom cells first. Each seam
+    backtracks like trace_path_njit() but skips pixels taken by earlier
+    seams, and is dropped if it runs into a dead end. The seams are stacked
+    in one (found * n, 2) array, seam s in rows s*n..(s+1)*n-1. With
+    n_paths=1 the result equals trace_path_njit().
+    """
+    n = memo.shape[0]
+    m = memo.shape[1]
+    taken = np.zeros((n, m), dtype=np.bool_)
+    paths = np.empty((n_paths * n, 2), dtype=np.int64)
+    candidate = np.empty(n, dtype=np.int64)
+    found = 0
+
+    for start in np.argsort(memo[n - 1], kind="mergesort"):
+        if found == n_paths:
+            break
+        if taken[n - 1, start]:
+            continue
+
+        j = start
+        candidate[n - 1] = j
+        dead_end = False
+        for i in range(n - 2, -1, -1):
+            next_j = -1
+            for c in (j, j - 1, j + 1):
+                if c < 0 or c >= m or taken[i, c]:
+                    continue
+                if next_j == -1 or memo[i, c] < memo[i, next_j]:
+                    next_j = c
+            if next_j == -1:
+                dead_end = True
+                break
+            j = next_j
+            candidate[i] = j
+        if dead_end:
+            continue
+
+        for i in range(n):
+            taken[i, candidate[i]] = True
+            paths[found * n + i, 0] = candidate[i]
+            paths[found * n + i, 1] = i
+        found += 1
+
+    return paths[: found * n]
+
+
+@njit(cache=True)
+def seam_band(path, height, i):
+    """Columns of row i whose 3x3 neighbourhood changed when path was removed.
+
+    path may hold several stacked seams (see trace_paths_njit()). Returns an
+    inclusive (lo, hi) range in the coordinates after the removal; columns
+    left of it map to the same pixels as before and columns right of it are
+    only shifted.
+    """
+    n_seams = path.shape[0] // height
+    lo = path[i, 0]
+    hi = path[i, 0]
+    for s in range(n_seams):
+        for r in range(max(i - 1, 0), min(i + 2, height)):
+            lo = min(lo, path[s * height + r, 0])
+            hi = max(hi, path[s * height + r, 0])
+    return lo - 1, hi - (n_seams - 1)
+
+
+@njit(cache=True)
+def update_memo_njit(memo, weights, path):
+    """Repair a memo table in place after a seam has been removed.
+
+    memo and weights must already have the seam removed (memo by the same
+    shift as the pixels). In each row the columns around the seam are
+    recomputed, together with every cell below a value that actually
+    changed. Once that cone spans the whole width the remaining rows are
+    rebuilt in full.
+
+    Returns the number of recomputed cells.
+    """
+    n = memo.shape[0]
+    m = memo.shape[1]
+    recomputed = 0
+    changed_lo = m
+    changed_hi = -1
+    for i in range(n):
+        lo, hi = seam_band(path, n, i)
+        lo = max(lo, 0)
+        hi = min(hi, m - 1)
+        if changed_hi >= 0:
+            lo = min(lo, max(changed_lo - 1, 0))
+            hi = max(hi, min(changed_hi + 1, m - 1))
+
+        if lo == 0 and hi == m - 1:
+            # The cone covers the whole width: rebuild the rest of the table
+            for k in range(i, n):
+                for j in range(m):
+                    path_cost = weights[k, j]
+                    if k > 0:
+                        best = memo[k - 1, j]
+                        if j > 0:
+                            best = min(best, memo[k - 1, j - 1])
+                        if j < m - 1:
+                            best = min(best, memo[k - 1, j + 1])
+                        path_cost += best
+                    memo[k, j] = path_cost
+            return recomputed + (n - i) * m
+
+        changed_lo = m
+        changed_hi = -1
+        for j in range(lo, hi + 1):
+            path_cost = weights[i, j]
+            if i > 0:
+                best = memo[i - 1, j]
+                if j > 0:
+                    best = min(best, memo[i - 1, j - 1])
+                if j < m - 1:
+                    best = min(best, memo[i - 1, j + 1])
+                path_cost += best
+            if memo[i, j] != path_cost:
+                memo[i, j] = path_cost
+                changed_lo = min(changed_lo, j)
+                changed_hi = max(changed_hi, j)
+        recomputed += hi - lo + 1
+    return recomputed
+
+
+class SeamFinder:
+    """Keeps the memo table of find_path_njit() alive between seam removals.
+
+    Usage:
+        finder = SeamFinder(weights)
+        path = finder.find_path()
+        ...remove the seam from the image and the weights...
+        finder.remove_path(path, new_weights)
+    """
+
+    def __init__(self, weights):
+        self.weights = weights
+        self.memo = build_memo_njit(weights)
+        self.recomputed = 0
+
+    def find_path(self):
+        if self.memo.shape[0] == 0 or self.memo.shape[1] == 0:
+            return np.empty((0, 2), dtype=np.int64)
+        return trace_path_njit(self.memo)
+
+    def find_paths(self, n_paths):
+        """Up to n_paths non-overlapping seams from the current memo table"""
+        if self.memo.shape[0] == 0 or self.memo.shape[1] == 0:
+            return np.empty((0, 2), dtype=np.int64)
+        return trace_paths_njit(self.memo, n_paths)
+
+    def remove_path(self, path, weights):
+        """weights is the weight matrix with the seam(s) already removed.
+
+        The memo table is narrowed in place, so self.memo becomes a view.
+        """
+        self.weights = weights
+        self.memo = remove_path_inplace(self.memo, path)
+        if self.memo.shape[1] > 0:
+            self.recomputed += update_memo_njit(self.memo, weights, path)
+
+
 def find_path(weights):
     """Wrapper function that calls njit version and converts output to list of tuples"""
     # Convert to numpy array if needed (for backward compatibility)
@@ -142,7 +564,521 @@ def get_weights(img):
     return np.array([[sum(pixel) for pixel in row] for row in rgb_data])
 
 
-def seam_carving(image, n_rows):
+def image_to_array(img):
+    """Convert a PIL image to a contiguous (height, width, 3) uint8 array"""
+    return np.ascontiguousarray(np.asarray(img.convert("RGB"), dtype=np.uint8))
+
+
+def array_to_image(pixels):
+    return Image.fromarray(pixels, "RGB")
+
+
+def get_weights_array(pixels):
+    """Same weights as get_weights(), computed directly on a uint8 array.
+
+    Mirrors ImageFilter.Kernel: each channel is clipped to [0, 255] and the
+    border pixels are copied unchanged from the source image.
+    """
+    channels = pixels.astype(np.int32)
+    height, width = pixels.shape[:2]
+    edges = channels.copy()
+    if height >= 3 and width >= 3:
+        diff = channels[:, :-2] - channels[:, 2:]
+        sobel = diff[:-2] + 2 * diff[1:-1] + diff[2:]
+        edges[1:-1, 1:-1] = np.clip(sobel, 0, 255)
+    return edges.sum(axis=2, dtype=np.int64)
+
+
+def remove_path(pixels, path):
+    """Remove the pixels of one or more stacked seams using a boolean mask"""
+    height, width = pixels.shape[:2]
+    new_width = width - len(path) // height
+    keep = np.ones((height, width), dtype=np.bool_)
+    keep[path[:, 1], path[:, 0]] = False
+    if pixels.ndim == 3:
+        # Masking whole channel runs is much faster than masking pixel tuples
+        keep = np.repeat(keep, pixels.shape[2], axis=1)
+        carved = pixels.reshape(height, -1)[keep]
+        return carved.reshape(height, new_width, pixels.shape[2])
+    return pixels[keep].reshape(height, new_width)
+
+
+@njit(cache=True)
+def remove_path_inplace(array, path):
+    """Shift each row of a 2D array left over the seam(s) and return the narrowed view"""
+    n = array.shape[0]
+    m = array.shape[1]
+    n_seams = path.shape[0] // n
+    if n_seams == 1:
+        for i in range(n):
+            for j in range(path[i, 0], m - 1):
+                array[i, j] = array[i, j + 1]
+        return array[:, : m - 1]
+
+    columns = np.empty(n_seams + 1, dtype=np.int64)
+    for i in range(n):
+        for s in range(n_seams):
+            columns[s] = path[s * n + i, 0]
+        columns[:n_seams].sort()
+        columns[n_seams] = m
+        for s in range(n_seams):
+            for j in range(columns[s] + 1, columns[s + 1]):
+                array[i, j - s - 1] = array[i, j]
+    return array[:, : m - n_seams]
+
+
+@njit(cache=True)
+def pixel_weight(pixels, i, j):
+    """Weight of a single pixel, identical to the matching cell of get_weights_array()"""
+    height = pixels.shape[0]
+    width = pixels.shape[1]
+    total = 0
+    if i == 0 or i == height - 1 or j == 0 or j == width - 1:
+        for c in range(pixels.shape[2]):
+            total += pixels[i, j, c]
+        return total
+    for c in range(pixels.shape[2]):
+        value = 0
+        for di in range(-1, 2):
+            scale = 2 if di == 0 else 1
+            value += scale * (
+                np.int32(pixels[i + di, j - 1, c]) - np.int32(pixels[i + di, j + 1, c])
+            )
+        if value > 255:
+            value = 255
+        elif value < 0:
+            value = 0
+        total += value
+    return total
+
+
+@njit(parallel=True, cache=True)
+def get_weights_parallel(pixels, tile_rows=64):
+    """get_weights_array() computed over tiles of tile_rows rows in parallel.
+
+    Every cell goes through pixel_weight(), so the result is identical to
+    get_weights_array() (and to the ImageFilter.Kernel path in get_weights()).
+    """
+    height = pixels.shape[0]
+    width = pixels.shape[1]
+    weights = np.empty((height, width), dtype=np.int64)
+    n_tiles = (height + tile_rows - 1) // tile_rows
+    for t in prange(n_tiles):
+        for i in range(t * tile_rows, min((t + 1) * tile_rows, height)):
+            for j in range(width):
+                weights[i, j] = pixel_weight(pixels, i, j)
+    return weights
+
+
+@njit(parallel=True, cache=True)
+def gradient_weights_njit(pixels):
+    """L1 gradient magnitude: |horizontal Sobel| + |vertical Sobel| over all channels.
+
+    Unlike get_weights_array() nothing is clipped, and the border pixels use
+    their nearest neighbours inside the image.
+    """
+    height = pixels.shape[0]
+    width = pixels.shape[1]
+    weights = np.empty((height, width), dtype=np.int64)
+    for i in prange(height):
+        above = max(i - 1, 0)
+        below = min(i + 1, height - 1)
+        for j in range(width):
+            left = max(j - 1, 0)
+            right = min(j + 1, width - 1)
+            total = 0
+            for c in range(pixels.shape[2]):
+                dx = 0
+                dy = 0
+                for d in range(-1, 2):
+                    scale = 2 if d == 0 else 1
+                    row = min(max(i + d, 0), height - 1)
+                    column = min(max(j + d, 0), width - 1)
+                    dx += scale * (
+                        np.int64(pixels[row, left, c]) - np.int64(pixels[row, right, c])
+                    )
+                    dy += scale * (
+                        np.int64(pixels[above, column, c])
+                        - np.int64(pixels[below, column, c])
+                    )
+                total += abs(dx) + abs(dy)
+            weights[i, j] = total
+    return weights
+
+
+@njit(cache=True)
+def pixel_weight_mapped(pixels, origin, i, j):
+    """pixel_weight() of the carved image whose pixel (i, j) is pixels[i, origin[i, j]]"""
+    height = origin.shape[0]
+    width = origin.shape[1]
+    total = 0
+    if i == 0 or i == height - 1 or j == 0 or j == width - 1:
+        for c in range(pixels.shape[2]):
+            total += pixels[i, origin[i, j], c]
+        return total
+    for c in range(pixels.shape[2]):
+        value = 0
+        for di in range(-1, 2):
+            scale = 2 if di == 0 else 1
+            left = origin[i + di, j - 1]
+            right = origin[i + di, j + 1]
+            value += scale * (
+                np.int32(pixels[i + di, left, c]) - np.int32(pixels[i + di, right, c])
+            )
+        if value > 255:
+            value = 255
+        elif value < 0:
+            value = 0
+        total += value
+    return total
+
+
+@njit(cache=True)
+def update_weights_mapped_njit(weights, pixels, origin, path):
+    """update_weights_njit() reading the carved image through origin.
+
+    pixels is the uncarved image and origin[i, j] the original column of
+    carved pixel (i, j), so no carved copy of the image is needed.
+    """
+    height = origin.shape[0]
+    width = origin.shape[1]
+    for i in range(height):
+        lo, hi = seam_band(path, height, i)
+        for j in range(max(lo, 0), min(hi + 1, width)):
+            weights[i, j] = pixel_weight_mapped(pixels, origin, i, j)
+
+
+@njit(cache=True)
+def update_weights_njit(weights, pixels, path):
+    """Recompute weights in place around the seam(s) that were just removed.
+
+    Both weights and pixels must already have the seams removed. A pixel's
+    weight only depends on its 3x3 neighbourhood, so in row i only the
+    columns between the seams' positions in rows i-1..i+1 can change.
+    """
+    height = pixels.shape[0]
+    width = pixels.shape[1]
+    for i in range(height):
+        lo, hi = seam_band(path, height, i)
+        for j in range(max(lo, 0), min(hi + 1, width)):
+            weights[i, j] = pixel_weight(pixels, i, j)
+
+
+def sobel_energy(pixels, mask):
+    return get_weights_parallel(pixels)
+
+
+def gradient_energy(pixels, mask):
+    return gradient_weights_njit(pixels)
+
+
+def forward_energy(pixels, mask):
+    """Intensity map for find_path_njit(..., forward=True)"""
+    return pixels.sum(axis=2, dtype=np.int64)
+
+
+def saliency_energy(pixels, mask):
+    """Sobel weights scaled by 1 + mask, so pixels with a high mask value are kept.
+
+    Integer masks are used as they are (e.g. 0-255 from a grayscale image).
+    Float masks are taken as saliency in [0, 1] and scaled to 0-255 first, so
+    they are not truncated to 0.
+    """
+    if mask is None:
+        raise ValueError('energy="saliency" needs a mask')
+    if np.issubdtype(mask.dtype, np.floating):
+        mask = np.rint(mask * 255)
+    return get_weights_parallel(pixels) * (1 + mask.astype(np.int64))
+
+
+# Every energy takes (pixels, mask) and returns an int64 (height, width)
+# matrix. "forward" marks energies whose matrix is passed to the forward
+# energy DP instead of being used as weights directly.
+ENERGIES = {
+    "sobel": {"function": sobel_energy, "forward": False},
+    "gradient": {"function": gradient_energy, "forward": False},
+    "forward": {"function": forward_energy, "forward": True},
+    "saliency": {"function": saliency_energy, "forward": False},
+}
+
+
+def seam_carving_energy(pixels, n_rows, energy, mask=None, stats=None):
+    """Carve n_rows seams from a uint8 array with an energy from ENERGIES.
+
+    The energy is recomputed on the whole image for every seam. mask, if
+    given, is a (height, width) array that loses the same pixels as the
+    image. See seam_carving_array() for stats.
+    """
+    if energy not in ENERGIES:
+        raise ValueError(f"Unknown energy: {energy}")
+    function = ENERGIES[energy]["function"]
+    forward = ENERGIES[energy]["forward"]
+    for _ in range(n_rows):
+        weights = function(pixels, mask)
+        path = find_path_njit(weights, forward)
+        if stats is not None and not forward:
+            energy_removed = int(weights[path[:, 1], path[:, 0]].sum())
+            stats["removed_energy"] = stats.get("removed_energy", 0) + energy_removed
+        pixels = remove_path(pixels, path)
+        if mask is not None:
+            mask = remove_path(mask, path)
+    return pixels
+
+
+def seam_carving_array(
+    pixels, n_rows, incremental=True, seams_per_pass=1, stats=None, memory_mode="full"
+):
+    """Carve n_rows seams from a uint8 array.
+
+    With incremental=True the weight matrix is kept between seams and only
+    the band around each removed seam is recomputed.
+
+    seams_per_pass > 1 removes up to that many non-overlapping seams per
+    memo table (see trace_paths_njit()). This is an approximation: later
+    seams in a pass do not see the image change caused by earlier ones.
+
+    memory_mode="low" finds every seam with find_path_lowmem_njit() instead
+    of keeping a full memo table, and removes the same seams. It only
+    supports seams_per_pass=1.
+
+    If stats is a dict, the total weight of the removed pixels is added to
+    stats["removed_energy"].
+    """
+    if memory_mode not in ("full", "low"):
+        raise ValueError(f"Unknown memory_mode: {memory_mode}")
+    low_memory = memory_mode == "low"
+    if low_memory and seams_per_pass != 1:
+        raise ValueError('memory_mode="low" only supports seams_per_pass=1')
+    incremental = incremental and not low_memory
+    height = pixels.shape[0]
+    weights = get_weights_parallel(pixels)
+    finder = SeamFinder(weights) if incremental else None
+    removed = 0
+    while removed < n_rows:
+        n_paths = min(seams_per_pass, n_rows - removed)
+        if low_memory:
+            path = find_path_lowmem_njit(weights)
+        elif incremental:
+            path = finder.find_path() if n_paths == 1 else finder.find_paths(n_paths)
+        elif n_paths == 1:
+            path = find_path_njit(weights)
+        else:
+            path = trace_paths_njit(build_memo_njit(weights), n_paths)
+        if stats is not None:
+            energy = int(weights[path[:, 1], path[:, 0]].sum())
+            stats["removed_energy"] = stats.get("removed_energy", 0) + energy
+
+        pixels = remove_path(pixels, path)
+        if incremental or low_memory:
+            weights = remove_path_inplace(weights, path)
+            update_weights_njit(weights, pixels, path)
+            if incremental:
+                finder.remove_path(path, weights)
+        else:
+            weights = get_weights_array(pixels)
+        removed += len(path) // height
+    return pixels
+
+
+def benchmark_energy(width=6000, height=4000, repeats=3):
+    """Time get_weights_parallel() with 1 up to all threads on a random image"""
+    rng = np.random.default_rng(0)
+    pixels = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+    get_weights_parallel(pixels[:8, :8])
+
+    start = time.perf_counter()
+    reference = get_weights_array(pixels)
+    numpy_time = time.perf_counter() - start
+    print(f"Energy of {width}x{height} ({width * height / 1e6:.0f} MP):")
+    print(f"  get_weights_array: {numpy_time:8.3f}s")
+
+    max_threads = get_num_threads()
+    threads = sorted({1, 2, 4, 8, max_threads} & set(range(1, max_threads + 1)))
+    results = {}
+    for n_threads in threads:
+        set_num_threads(n_threads)
+        elapsed = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            weights = get_weights_parallel(pixels)
+            elapsed = min(elapsed, time.perf_counter() - start)
+        results[n_threads] = elapsed
+        print(
+            f"  {n_threads:>2} threads:        {elapsed:8.3f}s "
+            f"({results[threads[0]] / elapsed:.2f}x, "
+            f"identical: {np.array_equal(weights, reference)})"
+        )
+    set_num_threads(max_threads)
+    return results
+
+
+def benchmark_energies(image, mask=None, repeats=3):
+    """Throughput in megapixels/second of every energy in ENERGIES and its seam DP"""
+    pixels = image_to_array(image)
+    height, width = pixels.shape[:2]
+    if mask is None:
+        mask = np.zeros((height, width), dtype=np.uint8)
+    megapixels = width * height / 1e6
+
+    print(f"Energy throughput on {width}x{height}:")
+    print(f"{'energy':>10} {'energy MP/s':>12} {'seam MP/s':>10}")
+    results = {}
+    for name, entry in ENERGIES.items():
+        function = entry["function"]
+        find_path_njit(function(pixels[:8, :8], mask[:8, :8]), entry["forward"])
+        energy_time = float("inf")
+        path_time = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            weights = function(pixels, mask)
+            energy_time = min(energy_time, time.perf_counter() - start)
+            start = time.perf_counter()
+            find_path_njit(weights, entry["forward"])
+            path_time = min(path_time, time.perf_counter() - start)
+        results[name] = (megapixels / energy_time, megapixels / path_time)
+        print(f"{name:>10} {results[name][0]:>12.1f} {results[name][1]:>10.1f}")
+    return results
+
+
+def benchmark_startup(runs=3):
+    """Import-to-first-seam latency of a new process, without and with the cache.
+
+    The first run of each kind uses an empty NUMBA_CACHE_DIR, so it has to
+    compile everything; the following runs load from that cache.
+    """
+    script = (
+        "import time; start = time.perf_counter(); "
+        "import numpy as np; from seam_carving import get_weights_array, find_path_njit; "
+        "pixels = np.zeros((64, 64, 3), dtype=np.uint8); "
+        "find_path_njit(get_weights_array(pixels)); "
+        "print(time.perf_counter() - start)"
+    )
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = dict(os.environ, NUMBA_CACHE_DIR=cache_dir)
+        latencies = []
+        for _ in range(runs + 1):
+            result = subprocess.run(
+                [sys.executable, "-c", script],
+                cwd=current_dir,
+                env=env,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            latencies.append(float(result.stdout))
+
+    print("Import to first seam:")
+    print(f"  cold cache: {latencies[0]:8.3f}s")
+    print(f"  warm cache: {min(latencies[1:]):8.3f}s")
+    return latencies
+
+
+def benchmark_seams_per_pass(image, n_rows=row_reduction, passes=(1, 2, 4, 8, 16)):
+    """Time and removed energy of seams_per_pass=k relative to exact k=1"""
+    pixels = image_to_array(image)
+    for k in passes:
+        seam_carving_array(pixels[:8, :8], 4, seams_per_pass=k)
+
+    print(f"Removing {n_rows} seams from {pixels.shape[1]}x{pixels.shape[0]}:")
+    print(f"{'k':>4} {'time':>9} {'speedup':>8} {'energy':>12} {'vs exact':>9}")
+    results = {}
+    for k in passes:
+        stats = {}
+        start = time.perf_counter()
+        seam_carving_array(pixels, n_rows, seams_per_pass=k, stats=stats)
+        results[k] = (time.perf_counter() - start, stats["removed_energy"])
+
+    exact_time, exact_energy = results[passes[0]]
+    for k, (elapsed, energy) in results.items():
+        print(
+            f"{k:>4} {elapsed:>8.3f}s {exact_time / elapsed:>7.2f}x "
+            f"{energy:>12} {energy / exact_energy:>8.3f}x"
+        )
+    return results
+
+
+def benchmark_memo_reuse(image, n_rows=row_reduction):
+    """Compare rebuilding the memo table per seam with SeamFinder on one image"""
+    pixels = image_to_array(image)
+    seam_carving_array(pixels[:8, :8], 2)
+    seam_carving_array(pixels[:8, :8], 2, incremental=False)
+
+    results = {}
+    for name, use_finder in (("full rebuild", False), ("SeamFinder", True)):
+        carved = pixels
+        weights = get_weights_array(carved)
+        finder = SeamFinder(weights) if use_finder else None
+        dp_time = 0.0
+        for i in range(n_rows):
+            start = time.perf_counter()
+            path = finder.find_path() if use_finder else find_path_njit(weights)
+            dp_time += time.perf_counter() - start
+            carved = remove_path(carved, path)
+            if use_finder:
+                weights = remove_path_inplace(weights, path)
+            else:
+                # Keep the weights contiguous so the full rebuild runs at its best
+                weights = remove_path(weights, path)
+            update_weights_njit(weights, carved, path)
+            if use_finder:
+                start = time.perf_counter()
+                finder.remove_path(path, weights)
+                dp_time += time.perf_counter() - start
+        results[name] = (dp_time, carved)
+
+    full_time, full_result = results["full rebuild"]
+    finder_time, finder_result = results["SeamFinder"]
+    height, width = pixels.shape[:2]
+    total_cells = sum(height * (width - i) for i in range(n_rows))
+    print(f"Memo table work for {n_rows} seams on {width}x{height}:")
+    print(f"  full rebuild: {full_time:8.3f}s")
+    print(f"  SeamFinder:   {finder_time:8.3f}s ({full_time / finder_time:.1f}x)")
+    print(f"  cells recomputed: {finder.recomputed / total_cells:.1%} of full rebuild")
+    print(f"  identical output: {np.array_equal(full_result, finder_result)}")
+    return results
+
+
+def seam_carving(
+    image,
+    n_rows,
+    mode="array",
+    seams_per_pass=1,
+    energy="sobel",
+    mask=None,
+    memory_mode="full",
+):
+    """Remove n_rows seams from the image.
+
+    mode="array" keeps the image as a single uint8 array for the whole carve
+    and converts back to PIL once at the end. The output is byte-identical to
+    the original per-pixel mode="pil".
+
+    seams_per_pass > 1 trades exactness for speed, and memory_mode="low"
+    keeps only two rows of the memo table, see seam_carving_array().
+
+    energy selects an entry of ENERGIES; mask is only used by "saliency".
+    Energies other than "sobel" are recomputed in full for every seam.
+    """
+    if energy != "sobel":
+        if mode != "array" or seams_per_pass != 1 or memory_mode != "full":
+            raise ValueError('Only energy="sobel" supports these options')
+        pixels = image_to_array(image)
+        return array_to_image(seam_carving_energy(pixels, n_rows, energy, mask))
+    if mode == "array":
+        pixels = seam_carving_array(
+            image_to_array(image),
+            n_rows,
+            seams_per_pass=seams_per_pass,
+            memory_mode=memory_mode,
+        )
+        return array_to_image(pixels)
+    if mode != "pil":
+        raise ValueError(f"Unknown mode: {mode}")
+    if seams_per_pass != 1:
+        raise ValueError('seams_per_pass is only supported with mode="array"')
+    if memory_mode != "full":
+        raise ValueError('memory_mode is only supported with mode="array"')
+
     for i in range(n_rows):
         print(f"Removing row {i} of {n_rows}")
         # Finn vektene med et filter
@@ -160,7 +1096,431 @@ def seam_carving(image, n_rows):
     return image
 
 
+def carve_frames(frames, n_rows, radius=8, keyframe_interval=None):
+    """Lazily carve n_rows seams from every frame of a clip.
+
+    frames may be any iterable of PIL images or uint8 arrays of the same
+    size, and the carved frames are yielded in the same form. The first
+    frame is carved like seam_carving_array(); in the following frames seam
+    s is searched only within radius columns of seam s in the previous frame
+    (see find_path_banded_njit()), which keeps the seams stable between
+    frames and makes each search O(height * radius). Every
+    keyframe_interval frames a full search is done instead.
+
+    Within a frame only the weights and the original column of every pixel
+    are narrowed per seam; the pixels are gathered once at the end. Only
+    the previous frame's seams are kept, so memory does not grow with the
+    clip.
+
+    Raises ValueError (when the first frame is requested) if
+    keyframe_interval is below 1, and when a frame's size differs from the
+    first frame's, since the banded search would read past the previous seams.
+    """
+    if keyframe_interval is not None and keyframe_interval < 1:
+        raise ValueError(
+            f"keyframe_interval must be at least 1, got {keyframe_interval}"
+        )
+    previous = None
+    shape = None
+    for index, frame in enumerate(frames):
+        is_image = isinstance(frame, Image.Image)
+        pixels = image_to_array(frame) if is_image else frame
+        if shape is None:
+            shape = pixels.shape[:2]
+        elif pixels.shape[:2] != shape:
+            raise ValueError(
+                f"frame {index} is {pixels.shape[1]}x{pixels.shape[0]}, "
+                f"expected {shape[1]}x{shape[0]} like the first frame"
+            )
+        keyframe = previous is None or (
+            keyframe_interval is not None and index % keyframe_interval == 0
+        )
+
+        height, width = pixels.shape[:2]
+        weights = get_weights_parallel(pixels)
+        origin = np.repeat(np.arange(width, dtype=np.int64)[None, :], height, axis=0)
+        finder = SeamFinder(weights) if keyframe else None
+        seams = np.empty((n_rows, height), dtype=np.int64)
+        for s in range(n_rows):
+            if keyframe:
+                path = finder.find_path()
+            else:
+                path = find_path_banded_njit(weights, previous[s], radius)
+            seams[s] = path[:, 0]
+            weights = remove_path_inplace(weights, path)
+            origin = remove_path_inplace(origin, path)
+            update_weights_mapped_njit(weights, pixels, origin, path)
+            if keyframe:
+                finder.remove_path(path, weights)
+        previous = seams
+
+        carved = pixels[np.arange(height)[:, None], origin]
+        yield array_to_image(carved) if is_image else carved
+
+
+def benchmark_frames(image, n_rows=100, n_frames=10, radius=8, noise=4, seed=0):
+    """Per-frame time of carve_frames() against a full carve of every frame.
+
+    The clip is the image with a little random noise per frame.
+    """
+    rng = np.random.default_rng(seed)
+    base = image_to_array(image).astype(np.int16)
+    frames = [
+        np.clip(base + rng.integers(-noise, noise + 1, base.shape), 0, 255).astype(
+            np.uint8
+        )
+        for _ in range(n_frames)
+    ]
+    list(carve_frames([frames[0][:16, :16]] * 2, 2))
+    seam_carving_array(frames[0][:16, :16], 2)
+
+    start = time.perf_counter()
+    for frame in frames:
+        seam_carving_array(frame, n_rows)
+    full_time = (time.perf_counter() - start) / n_frames
+
+    times = []
+    start = time.perf_counter()
+    for _ in carve_frames(frames, n_rows, radius):
+        times.append(time.perf_counter() - start)
+        start = time.perf_counter()
+    keyframe_time = times[0]
+    banded_time = sum(times[1:]) / max(len(times) - 1, 1)
+
+    height, width = base.shape[:2]
+    print(f"Carving {n_rows} seams per frame from {width}x{height}:")
+    print(f"  full carve:     {full_time:8.3f}s per frame")
+    print(f"  keyframe:       {keyframe_time:8.3f}s ({full_time / keyframe_time:.2f}x)")
+    print(
+        f"  banded (r={radius:<2}): {banded_time:8.3f}s ({full_time / banded_time:.2f}x)"
+    )
+    return full_time, keyframe_time, banded_time
+
+
+def find_seams_array(pixels, n_seams):
+    """Columns in pixels of the n_seams cheapest seams, as a (height, n_seams) array.
+
+    The seams are removed one at a time from a working copy, like
+    seam_carving_array(), while an index array remembers which original
+    column each remaining pixel came from. Within a row the columns are
+    distinct.
+    """
+    height, width = pixels.shape[:2]
+    origin = np.repeat(np.arange(width, dtype=np.int64)[None, :], height, axis=0)
+    seams = np.empty((height, n_seams), dtype=np.int64)
+    weights = get_weights_array(pixels)
+    finder = SeamFinder(weights)
+    for s in range(n_seams):
+        path = finder.find_path()
+        seams[:, s] = origin[path[:, 1], path[:, 0]]
+        pixels = remove_path(pixels, path)
+        origin = remove_path_inplace(origin, path)
+        weights = remove_path_inplace(weights, path)
+        update_weights_njit(weights, pixels, path)
+        finder.remove_path(path, weights)
+    return seams
+
+
+def seam_enlarge_array(pixels, n_seams):
+    """Widen a uint8 array by n_seams columns.
+
+    The seams from find_seams_array() are inserted into the original in one
+    pass: each seam pixel is kept and followed by the average of itself and
+    its right neighbour.
+    """
+    height, width = pixels.shape[:2]
+    if n_seams > width:
+        raise ValueError("seam_enlarge_array can add at most width seams at once")
+    seams = find_seams_array(pixels, n_seams)
+    duplicate = np.zeros((height, width), dtype=np.bool_)
+    duplicate[np.arange(height)[:, None], seams] = True
+
+    right = np.concatenate((pixels[:, 1:], pixels[:, -1:]), axis=1)
+    average = ((pixels.astype(np.uint16) + right) // 2).astype(np.uint8)
+
+    counts = duplicate.ravel() + 1
+    flat = pixels.reshape(height * width, -1)
+    enlarged = np.repeat(flat, counts, axis=0)
+    # The last copy of every duplicated pixel is the inserted one
+    inserted = np.cumsum(counts)[duplicate.ravel()] - 1
+    enlarged[inserted] = average.reshape(height * width, -1)[duplicate.ravel()]
+    return enlarged.reshape(height, width + n_seams, *pixels.shape[2:])
+
+
+def seam_enlarge(image, n_seams):
+    """Add n_seams low-energy seams to the image, the inverse of seam_carving()"""
+    return array_to_image(seam_enlarge_array(image_to_array(image), n_seams))
+
+
+def cheapest_seam(pixels, horizontal=False):
+    """Cheapest vertical seam of pixels, or horizontal seam with horizontal=True.
+
+    Horizontal seams are found on a transposed view (pixels.swapaxes(0, 1)),
+    so find_path_njit() runs on strided weights and no transposed copy of
+    the image is made. Returns the path in the view's coordinates and its
+    total weight.
+    """
+    view = pixels.swapaxes(0, 1) if horizontal else pixels
+    weights = get_weights_array(view)
+    path = find_path_njit(weights)
+    return path, int(weights[path[:, 1], path[:, 0]].sum())
+
+
+def remove_seam(pixels, path, horizontal=False):
+    """Remove a path returned by cheapest_seam() with the same orientation"""
+    if not horizontal:
+        return remove_path(pixels, path)
+    return remove_path(pixels.swapaxes(0, 1), path).swapaxes(0, 1)
+
+
+def carve_horizontal(pixels, n_rows, **kwargs):
+    """seam_carving_array() for horizontal seams, run on a transposed view"""
+    return seam_carving_array(pixels.swapaxes(0, 1), n_rows, **kwargs).swapaxes(0, 1)
+
+
+def retarget_array(pixels, new_width, new_height, order="optimal"):
+    """Shrink a uint8 array to new_width x new_height.
+
+    order="optimal" picks the order of vertical and horizontal seams with the
+    transport map DP: T[r, c] is the cheapest total energy of removing r
+    horizontal and c vertical seams, taken over removing a horizontal seam
+    from the image at (r - 1, c) or a vertical seam from the image at
+    (r, c - 1). This needs two seam searches per cell and keeps one row of
+    the table's images in memory.
+
+    order="greedy" instead removes whichever of the two cheapest seams is
+    cheaper at each step, which needs only two seam searches per seam.
+
+    Returns the carved array and the removal order as a string of "v"
+    (vertical seam) and "h" (horizontal seam).
+    """
+    height, width = pixels.shape[:2]
+    n_cols = width - new_width
+    n_rows = height - new_height
+    if n_cols < 0 or n_rows < 0:
+        raise ValueError("retarget_array can only shrink the image")
+
+    if order == "greedy":
+        steps = []
+        while n_cols > 0 or n_rows > 0:
+            candidates = []
+            if n_cols > 0:
+                candidates.append((*cheapest_seam(pixels), False))
+            if n_rows > 0:
+                candidates.append((*cheapest_seam(pixels, horizontal=True), True))
+            path, _, horizontal = min(candidates, key=lambda x: x[1])
+            pixels = remove_seam(pixels, path, horizontal)
+            if horizontal:
+                n_rows -= 1
+            else:
+                n_cols -= 1
+            steps.append("h" if horizontal else "v")
+        return pixels, "".join(steps)
+    if order != "optimal":
+        raise ValueError(f"Unknown order: {order}")
+
+    cost = np.zeros((n_rows + 1, n_cols + 1), dtype=np.int64)
+    from_above = np.zeros((n_rows + 1, n_cols + 1), dtype=np.bool_)
+    # above[c] is the image (and its cheapest horizontal seam) at (r - 1, c),
+    # left the image (and its cheapest vertical seam) at (r, c - 1)
+    above = [None] * (n_cols + 1)
+    for r in range(n_rows + 1):
+        current = [None] * (n_cols + 1)
+        left = None
+        for c in range(n_cols + 1):
+            if r == 0 and c == 0:
+                image = pixels
+            else:
+                options = []
+                if r > 0:
+                    image_above, path, energy = above[c]
+                    options.append((cost[r - 1, c] + energy, True, image_above, path))
+                if c > 0:
+                    image_left, path, energy = left
+                    options.append((cost[r, c - 1] + energy, False, image_left, path))
+                total, horizontal, image, path = min(options, key=lambda x: x[0])
+                cost[r, c] = total
+                from_above[r, c] = horizontal
+                image = remove_seam(image, path, horizontal)
+            if r < n_rows:
+                current[c] = (image, *cheapest_seam(image, horizontal=True))
+            if c < n_cols:
+                left = (image, *cheapest_seam(image))
+        above = current
+
+    steps = []
+    r, c = n_rows, n_cols
+    while r > 0 or c > 0:
+        if from_above[r, c]:
+            steps.append("h")
+            r -= 1
+        else:
+            steps.append("v")
+            c -= 1
+    return image, "".join(reversed(steps))
+
+
+def retarget(image, new_width, new_height, order="optimal"):
+    """Shrink a PIL image to new_width x new_height with vertical and horizontal seams"""
+    pixels, _ = retarget_array(image_to_array(image), new_width, new_height, order)
+    return array_to_image(np.ascontiguousarray(pixels))
+
+
+def warmup(dtypes=(np.int32, np.int64, np.float32)):
+    """Compile the njit functions for the weight dtypes we use.
+
+    The compiled code is cached on disk (cache=True), so after the first run
+    this only loads it. Also used to warm up every pool worker once before
+    any image arrives.
+    """
+    for dtype in dtypes:
+        weights = np.arange(12, dtype=dtype).reshape(3, 4)
+        find_path_njit(weights)
+        finder = SeamFinder(weights.copy())
+        path = finder.find_path()
+        finder.remove_path(path, remove_path_inplace(weights.copy(), path))
+        finder.find_paths(2)
+    seam_carving_array(np.zeros((8, 8, 3), dtype=np.uint8), 2)
+
+
+def glob_root(pattern):
+    """The leading directories of a glob pattern that contain no wildcards"""
+    root = Path()
+    for part in Path(pattern).parts[:-1]:
+        if glob.has_magic(part):
+            break
+        root /= part
+    return root
+
+
+def carve_file(path, output_path, width, seams_per_pass=1, height=None):
+    """Carve one image file down to width x height and save it as output_path.
+
+    width or height may be None to keep that dimension; images already
+    smaller than a target keep their size in it. Only vertical seams are
+    removed with seams_per_pass; with a height, both kinds of seams are
+    removed by retarget_array(order="greedy").
+
+    Returns (path, seconds, megapixels) for carve_directory()'s report.
+    """
+    start = time.perf_counter()
+    image = Image.open(path)
+    megapixels = image.width * image.height / 1e6
+    new_width = image.width if width is None else min(width, image.width)
+    if height is None:
+        pixels = seam_carving_array(
+            image_to_array(image),
+            image.width - new_width,
+            seams_per_pass=seams_per_pass,
+        )
+    else:
+        pixels, _ = retarget_array(
+            image_to_array(image),
+            new_width,
+            min(height, image.height),
+            order="greedy",
+        )
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    array_to_image(pixels).save(output_path)
+    return path, time.perf_counter() - start, megapixels
+
+
+def carve_directory(
+    pattern, output_dir, width, workers=None, seams_per_pass=1, height=None
+):
+    """Carve every image matching the glob pattern in a process pool.
+
+    See carve_file() for width, height and seams_per_pass.
+
+    Outputs keep their path relative to the pattern's directory prefix (see
+    glob_root()), so equal file names in different directories do not
+    overwrite each other. Each image is saved as soon as its worker
+    finishes, and its latency is printed in completion order. Images that
+    fail are reported and skipped, and the summary counts them.
+
+    Returns the paths that failed.
+    """
+    paths = sorted(glob.glob(pattern, recursive=True))
+    root = glob_root(pattern)
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count()
+
+    start = time.perf_counter()
+    total_megapixels = 0.0
+    failed = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=warmup) as pool:
+        futures = {
+            pool.submit(
+                carve_file,
+                path,
+                Path(output_dir) / Path(path).relative_to(root),
+                width,
+                seams_per_pass,
+                height,
+            ): path
+            for path in paths
+        }
+        for future in as_completed(futures):
+            try:
+                path, elapsed, megapixels = future.result()
+            except Exception as error:
+                failed.append(futures[future])
+                print(f"  failed  {futures[future]}: {error!r}")
+                continue
+            total_megapixels += megapixels
+            print(f"{elapsed:8.3f}s  {path}")
+    elapsed = time.perf_counter() - start
+
+    carved = len(paths) - len(failed)
+    print(
+        f"{carved} images in {elapsed:.2f}s with {workers} workers: "
+        f"{carved / elapsed:.2f} images/s, {total_megapixels / elapsed:.2f} MP/s"
+    )
+    if failed:
+        print(f"{len(failed)} images failed")
+    return failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Seam carve every image matching a glob down to a given size"
+    )
+    parser.add_argument("pattern", help='input glob, e.g. "thumbnails/**/*.jpg"')
+    parser.add_argument("output_dir")
+    parser.add_argument("--width", type=int, default=None, help="target width")
+    parser.add_argument("--height", type=int, default=None, help="target height")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument(
+        "--seams-per-pass",
+        type=int,
+        default=1,
+        help="vertical seams per DP pass, only used without --height",
+    )
+    args = parser.parse_args(argv)
+    if args.width is None and args.height is None:
+        parser.error("give --width, --height or both")
+    failed = carve_directory(
+        args.pattern,
+        args.output_dir,
+        args.width,
+        args.workers,
+        args.seams_per_pass,
+        args.height,
+    )
+    return 1 if failed else 0
+
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(main())
+
     image = Image.open(current_dir / image_name)
+    if run_benchmark:
+        benchmark_startup()
+        benchmark_energy()
+        benchmark_energies(image)
+        benchmark_memo_reuse(image)
+        benchmark_seams_per_pass(image)
+        benchmark_frames(image)
     image = seam_carving(image, row_reduction)
     image.save(current_dir / f"seam_carved_{row_reduction}_{image_name}")
@@ -189,6 +189,96 @@ def run_tests():
         print("all successful")
 
 
+def test_equivalences(trials=20, seed=0):
+    """Check the optimised seam finders in seam_carving.py against the plain ones.
+
+    Runs on small random matrices with values in 0..2, so there are many
+    ties, and the optimised versions must return exactly the same tables,
+    paths and weights.
+    """
+    import numpy as np
+    import seam_carving
+
+    errors = []
+
+    def check(condition, name):
+        if not condition:
+            errors.append(f"{name} failed")
+
+    rng = np.random.default_rng(seed)
+    shapes = [(1, 1), (1, 5), (5, 1), (2, 2), (7, 3), (12, 20), (40, 9), (70, 33)]
+    for trial in range(trials):
+        for height, width in shapes:
+            weights = rng.integers(0, 3, (height, width)).astype(np.int64)
+            name = f"{height}x{width} trial {trial}"
+            path = seam_carving.find_path_njit(weights)
+
+            # Low-memory finder (two cost rows and backpointers)
+            lowmem = seam_carving.find_path_lowmem_njit(weights)
+            check(np.array_equal(lowmem, path), f"lowmem path {name}")
+
+            # Tiled DP with stripes and blocks small enough to exercise the halos
+            memo = seam_carving.build_memo_njit(weights)
+            for stripe in (1, 2, 5, seam_carving.tiled_stripe(width)):
+                for block_rows in (1, 3, 64):
+                    tiled = seam_carving.build_memo_tiled_njit(
+                        weights, stripe, block_rows
+                    )
+                    check(
+                        np.array_equal(tiled, memo),
+                        f"tiled memo {name} stripe {stripe} block {block_rows}",
+                    )
+            tiled_path = seam_carving.find_path_tiled(weights, 2, 3)
+            check(np.array_equal(tiled_path, path), f"tiled path {name}")
+
+        # SeamFinder repairs its memo table like a rebuild after every removal
+        weights = rng.integers(0, 3, (30, 25)).astype(np.int64)
+        finder = seam_carving.SeamFinder(weights.copy())
+        for removal in range(20):
+            name = f"seam finder trial {trial} removal {removal}"
+            if removal % 4 == 3:
+                path = finder.find_paths(3)
+            else:
+                path = finder.find_path()
+                check(
+                    np.array_equal(path, seam_carving.find_path_njit(weights)),
+                    f"path of {name}",
+                )
+            weights = seam_carving.remove_path(weights, path)
+            finder.remove_path(path, weights.copy())
+            check(
+                np.array_equal(finder.memo, seam_carving.build_memo_njit(weights)),
+                f"memo of {name}",
+            )
+
+        # Incremental weights match weights recomputed from the carved image
+        pixels = (rng.integers(0, 3, (25, 30, 3)) * 100).astype(np.uint8)
+        weights = seam_carving.get_weights_parallel(pixels)
+        for removal in range(15):
+            name = f"weights trial {trial} removal {removal}"
+            if removal % 4 == 3:
+                path = seam_carving.SeamFinder(weights).find_paths(2)
+            else:
+                path = seam_carving.find_path_njit(weights)
+            pixels = seam_carving.remove_path(pixels, path)
+            weights = seam_carving.remove_path_inplace(weights, path)
+            seam_carving.update_weights_njit(weights, pixels, path)
+            check(
+                np.array_equal(weights, seam_carving.get_weights_array(pixels)),
+                name,
+            )
+
+    if errors:
+        for e in errors:
+            print("Error:", e)
+    else:
+        print("all equivalence tests passed")
+    return errors
+
+
 # Run the suite
-# test_find_min(find_min_iterative)
-run_tests()
+if __name__ == "__main__":
+    # test_find_min(find_min_iterative)
+    run_tests()
+    if test_equivalences():
+        raise SystemExit("The optimised seam finders differ from the plain ones")